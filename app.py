@@ -1,67 +1,287 @@
-from flask import Flask, jsonify, request, render_template, Response, g
+from flask import Flask, jsonify, request, render_template, Response
+from flask.json.provider import DefaultJSONProvider
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-import numpy as np
+from typing import Optional, List, Dict, Any, Iterable
+import functools
+import itertools
+import operator
+import gzip
+import hashlib
+import orjson
 import os
 import threading
+import zlib
 
-from database import GHADatabase
+from database import (GHADatabase, JOB_EXECUTION_ORDER_BY, validate_conclusions,
+                      bump_data_version, get_data_version)
 from report_exporter import ReportExporter
-from utils import generate_github_job_url, analyze_repl_build_steps
+from utils import analyze_repl_build_steps, parse_iso_datetime
 from fetch_task_manager import FetchTaskManager, execute_fetch_task
 from stats_calculator import StatsCalculator
 from config_manager import ConfigManager
+from github_api_client import GitHubApiClient
+from trends import compute_trends
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson for jsonify() responses, request.get_json() and flask.json.
+
+    NumPy arrays and scalars are serialized natively. Dates are passed through to
+    Flask's default handler so their format matches the standard provider.
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            # Formatting options such as indent are only understood by the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        option = self.option | orjson.OPT_SORT_KEYS if self.sort_keys else self.option
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson.JSONDecodeError subclasses ValueError, so Flask's bad-request handling still applies
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option) + b"\n", mimetype=self.mimetype
+        )
+
+
+class ApiClientCache(LRUCache):
+    """LRU cache of GitHubApiClient instances that closes each client's session when it is evicted."""
+
+    def popitem(self):
+        key, client = super().popitem()
+        # Release the pooled sockets now rather than whenever the client is garbage collected
+        client.close()
+        return key, client
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 print("DEBUG: app.py loaded! ----------------------------------------", flush=True)
 
 # Configuration constants
 DEFAULT_EXCLUDE_STATUSES = ['in_progress', 'queued']
 ENABLE_FILTER_METADATA = True
 MAX_JOB_EXECUTIONS_LIMIT = 1000
+RESPONSE_CACHE_SIZE = 1024  # Maximum number of cached API responses
+RESPONSE_CACHE_TTL = 120  # Seconds a cached API response is kept
+TRENDS_CACHE_SIZE = 32  # Trend computations shared between /api/trends and /api/trends.csv
+TOKEN_VALIDATION_TTL = 60  # Seconds a GitHub token validation result is reused by /api/config/token/status
+GITHUB_TOKEN_PREFIXES = ('ghp_', 'github_pat_', 'gho_')  # Accepted GitHub token formats
+FETCH_STATUS_HEARTBEAT = 15  # Seconds between keep-alive comments on an idle fetch status stream
+FETCH_STATUS_MAX_STREAMS = int(os.environ.get('FETCH_STATUS_MAX_STREAMS', '2'))  # Open status streams; each holds a server thread
+PREVIEW_SAMPLE_DAYS = 7  # Length of each window sampled by /api/fetch/preview
+PREVIEW_SAMPLES = 3  # Windows sampled (concurrently) across the range by /api/fetch/preview
+GITHUB_RUNS_RESULT_LIMIT = 1000  # GitHub returns at most this many runs for a created-date filter
+GZIP_MIN_SIZE = 1024  # Buffered responses smaller than this (in bytes) are sent uncompressed
+GZIP_LEVEL = 1
+GZIP_MIMETYPES = {'application/json', 'text/csv', 'text/html', 'text/plain'}
 
 # In a real app, you might manage the DB connection differently (e.g., per-request context)
 # For simplicity, we'll create a new instance per request or use a global one.
 # Use environment variable with fallback to local path for development
 DB_PATH = os.environ.get('DB_PATH', os.path.join(os.path.dirname(__file__), 'data', 'gha_metrics.db'))
 CONFIG_PATH = os.environ.get('CONFIG_PATH', os.path.join(os.path.dirname(__file__), 'data', 'config.json'))
+# Fetch tasks run at most this many at a time; further tasks stay 'pending' until a worker is free
+FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', '2'))
 
 # Initialize global task manager for fetch operations
 task_manager = FetchTaskManager()
 
+# Thread pool that runs fetch tasks (created lazily, see _get_fetch_executor)
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = threading.Lock()
+
+# Thread pool that samples /api/fetch/preview windows (created lazily, see _get_preview_executor)
+_preview_executor: Optional[ThreadPoolExecutor] = None
+_preview_executor_lock = threading.Lock()
+
 # Initialize configuration manager for token management
 config_manager = ConfigManager(CONFIG_PATH)
 
+# In-process cache of serialized API responses (see cached_response)
+_response_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+
+# Trend computations for the current data version (see _cached_trends)
+_trends_cache = TTLCache(maxsize=TRENDS_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+_trends_cache_version: Optional[int] = None
+_trends_cache_lock = threading.Lock()
+
+# GitHub API clients (each holding a keep-alive session), keyed by request thread and a hash of
+# the token, since a requests.Session is not guaranteed to be safe to share between threads.
+# Sized for the server threads plus the preview pool threads, so neither evicts the other's clients
+_api_clients = ApiClientCache(maxsize=16)
+_api_clients_lock = threading.Lock()
+
+# Recent GitHub token validation results, keyed by a hash of the token (see _is_token_valid)
+_token_validation_cache = TTLCache(maxsize=16, ttl=TOKEN_VALIDATION_TTL)
+_token_validation_lock = threading.Lock()
+
+# Limits open fetch status streams so they cannot take every server thread (see fetch_status_stream)
+_fetch_status_streams = threading.BoundedSemaphore(FETCH_STATUS_MAX_STREAMS)
+
+# Read-only database connections, one per worker thread, reused across requests
+_thread_local = threading.local()
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """Returns the fetch task thread pool, creating it on first use (after any worker fork)."""
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='fetch')
+    return _fetch_executor
+
+def _get_preview_executor() -> ThreadPoolExecutor:
+    """Returns the preview sampling thread pool, creating it on first use (after any worker fork)."""
+    global _preview_executor
+    with _preview_executor_lock:
+        if _preview_executor is None:
+            _preview_executor = ThreadPoolExecutor(max_workers=PREVIEW_SAMPLES, thread_name_prefix='preview')
+    return _preview_executor
+
+def initialize_database():
+    """
+    Creates the schema and applies column migrations through a short-lived writable connection.
+
+    Request handlers only get read-only connections (see get_db), which cannot migrate an
+    older database, so this runs once at import time, before any request is served.
+    """
+    os.makedirs(os.path.dirname(DB_PATH) or '.', exist_ok=True)
+    with GHADatabase(DB_PATH) as db:
+        db.initialize_schema()
+
+initialize_database()
+
 def get_db():
-    """Opens a new database connection."""
-    if 'db' not in g:
-        g.db = GHADatabase(DB_PATH)
-        g.db.connect()
-    return g.db
-
-@app.teardown_appcontext
-def close_db(error):
-    """Closes the database connection at the end of the request."""
-    db = g.pop('db', None)
-    if db is not None:
-        db.close()
+    """Returns this thread's pooled read-only database connection, opening it on first use."""
+    db = getattr(_thread_local, 'db', None)
+    if db is None:
+        db = GHADatabase(DB_PATH, read_only=True, persistent=True)
+        db.connect()
+        _thread_local.db = db
+    return db
+
+def _json_array(encoded_items: Iterable[str]) -> str:
+    """
+    Join already-encoded JSON values into the text of one JSON array.
+
+    :param encoded_items: JSON text of each array element
+    :return: The array's JSON text, newline-terminated like jsonify output
+    """
+    return "[" + ",".join(encoded_items) + "]\n"
+
+def _gzip_stream(chunks):
+    """
+    Compresses a streamed response body chunk by chunk into a single gzip member.
 
+    The first chunk is sync-flushed so streamed responses keep their early first byte;
+    later chunks are left to the compressor's own buffering.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    chunks = iter(chunks)
+    for chunk in itertools.islice(chunks, 1):
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON/CSV/HTML responses for clients that accept it."""
+    if (response.status_code < 200 or response.status_code >= 300
+            or response.direct_passthrough
+            or response.mimetype not in GZIP_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_stream(response.iter_encoded())
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < GZIP_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+
+    response.headers['Content-Encoding'] = 'gzip'
+    # The body now differs byte-wise from the uncompressed representation
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     if not date_str:
         return None
     try:
         # Handle ISO format from JS (e.g., 2023-10-27T00:00:00.000Z)
-        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return parse_iso_datetime(date_str)
     except ValueError:
         return None
 
 
-def validate_fetch_params(data: Dict[str, Any]) -> tuple[bool, Optional[str], Optional[str]]:
+def _iso_utc(dt: datetime) -> str:
+    """Formats a datetime as 'YYYY-MM-DDTHH:MM:SSZ' without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+
+
+def _preview_sample_windows(start_date: datetime, end_date: datetime) -> tuple[List[tuple[str, str]], bool]:
+    """
+    Picks the date windows /api/fetch/preview counts runs in.
+
+    Ranges up to PREVIEW_SAMPLES windows long are split into consecutive windows that cover
+    them completely (each ending a second before the next starts, since GitHub's range
+    filter is inclusive). Longer ranges get PREVIEW_SAMPLES windows spread evenly from the
+    start to the end, so the estimate is not based on the first week alone.
+
+    :param start_date: Start of the range
+    :param end_date: End of the range
+    :return: Tuple of (list of (created_after, created_before) strings, whether the windows cover the range)
+    """
+    window = timedelta(days=PREVIEW_SAMPLE_DAYS)
+    span = end_date - start_date
+    if span <= window * PREVIEW_SAMPLES:
+        starts = []
+        window_start = start_date
+        while window_start < end_date:
+            starts.append(window_start)
+            window_start += window
+        windows = [(_iso_utc(a), _iso_utc(b - timedelta(seconds=1))) for a, b in zip(starts, starts[1:])]
+        windows.append((_iso_utc(starts[-1]), _iso_utc(end_date)))
+        return windows, True
+    step = (span - window) / (PREVIEW_SAMPLES - 1)
+    starts = [start_date + step * i for i in range(PREVIEW_SAMPLES)]
+    return [(_iso_utc(a), _iso_utc(a + window)) for a in starts], False
+
+def validate_fetch_params(data: Dict[str, Any]) -> tuple[bool, Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
     """
     Validate parameters for fetch operations.
     
     Returns:
-        tuple: (is_valid, error_message, error_type)
+        tuple: (is_valid, error_message, error_type, start_date, end_date), where the
+        dates are the parsed datetimes on success and None otherwise
     """
     # Check required parameters
     required_fields = ['owner', 'repo', 'workflow_id', 'start_date', 'end_date']
@@ -70,68 +290,74 @@ def validate_fetch_params(data: Dict[str, Any]) -> tuple[bool, Optional[str], Op
     if missing_fields:
         return (False, 
                 f"Missing required parameters: {', '.join(missing_fields)}", 
-                "validation")
+                "validation", None, None)
     
     # Validate date format
     try:
-        start_date = datetime.fromisoformat(data['start_date'].replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(data['end_date'].replace('Z', '+00:00'))
-    except (ValueError, AttributeError) as e:
+        start_date = parse_iso_datetime(data['start_date'])
+        end_date = parse_iso_datetime(data['end_date'])
+    except (ValueError, TypeError, AttributeError):
         return (False, 
                 "Invalid date format. Dates must be in ISO 8601 format (e.g., '2024-01-01T00:00:00Z')", 
-                "validation")
+                "validation", None, None)
     
     # Validate date range
     if end_date <= start_date:
         return (False, 
                 "Invalid date range. End date must be after start date", 
-                "validation")
+                "validation", None, None)
     
     # Check if start date is not too far in the future
     now = datetime.now(start_date.tzinfo)
     if start_date > now:
         return (False, 
                 "Start date cannot be in the future", 
-                "validation")
+                "validation", None, None)
     
     # Validate string parameters are not empty
     if not data['owner'].strip():
-        return (False, "Owner cannot be empty", "validation")
+        return (False, "Owner cannot be empty", "validation", None, None)
     if not data['repo'].strip():
-        return (False, "Repository name cannot be empty", "validation")
+        return (False, "Repository name cannot be empty", "validation", None, None)
     if not data['workflow_id'].strip():
-        return (False, "Workflow ID cannot be empty", "validation")
+        return (False, "Workflow ID cannot be empty", "validation", None, None)
     
-    return (True, None, None)
+    return (True, None, None, start_date, end_date)
 
 
-def parse_conclusions_param(conclusions_param: Optional[str]) -> Optional[List[str]]:
+@functools.lru_cache(maxsize=256)
+def parse_conclusions_param(conclusions_param: Optional[str]) -> Optional[tuple[str, ...]]:
     """
     Helper to parse comma-separated conclusions query parameter.
+
+    Results are memoized, so they are returned as (immutable) tuples.
     
     :param conclusions_param: Comma-separated string of conclusions (e.g., 'success,failure')
-    :return: List of conclusion strings, or None if parameter is empty
+    :return: Tuple of conclusion strings, or None if parameter is empty
     """
     if not conclusions_param:
         return None
-    conclusions = [c.strip() for c in conclusions_param.split(',') if c.strip()]
+    conclusions = tuple(filter(None, map(str.strip, conclusions_param.split(','))))
     return conclusions if conclusions else None
 
 
-def parse_exclude_statuses_param(exclude_statuses_param: Optional[str]) -> List[str]:
+@functools.lru_cache(maxsize=256)
+def parse_exclude_statuses_param(exclude_statuses_param: Optional[str]) -> tuple[str, ...]:
     """
     Helper to parse exclude_statuses parameter with default value.
+
+    Results are memoized, so they are returned as (immutable) tuples.
     
     :param exclude_statuses_param: Comma-separated string of statuses to exclude
-    :return: List of status strings to exclude (defaults to ['in_progress', 'queued'])
+    :return: Tuple of status strings to exclude (defaults to ('in_progress', 'queued'))
     """
     if exclude_statuses_param is None:
-        return ['in_progress', 'queued']
+        return ('in_progress', 'queued')
     
     if exclude_statuses_param == '':
-        return []
+        return ()
     
-    statuses = [s.strip() for s in exclude_statuses_param.split(',') if s.strip()]
+    statuses = tuple(filter(None, map(str.strip, exclude_statuses_param.split(','))))
     return statuses
 
 
@@ -157,6 +383,220 @@ def build_filter_metadata(conclusions: Optional[List[str]], exclude_statuses: Li
     
     return metadata
 
+
+@dataclass(frozen=True)
+class TrendParams:
+    """Validated query parameters shared by the trend endpoints (hashable, so usable as a cache key)."""
+    owner: str
+    repo: str
+    workflow_id: str
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    period: str
+    exclude_outliers: bool
+    include_outlier_count: bool
+    conclusions: Optional[tuple]
+    exclude_statuses: tuple
+
+
+def require_trend_params(view):
+    """
+    Decorator that parses and validates the trend query parameters once.
+
+    The wrapped view receives them as a ``params`` keyword argument (TrendParams);
+    invalid requests get a 400 response without calling the view.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        query = request.args
+        owner = query.get('owner')
+        repo = query.get('repo')
+        workflow_id = query.get('workflow_id')
+
+        if not (owner and repo and workflow_id):
+            return jsonify({"error": "Missing required parameters: owner, repo, workflow_id"}), 400
+
+        period = query.get('period', 'day')
+        if period not in ['day', 'week']:
+            return jsonify({"error": "Invalid 'period' parameter. Must be 'day' or 'week'."}), 400
+
+        try:
+            # Rejected here so a bad filter never reaches the database
+            conclusions = validate_conclusions(parse_conclusions_param(query.get('conclusions')))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        kwargs['params'] = TrendParams(
+            owner=owner,
+            repo=repo,
+            workflow_id=workflow_id,
+            start_date=parse_date(query.get('start_date')),
+            end_date=parse_date(query.get('end_date')),
+            period=period,
+            exclude_outliers=query.get('exclude_outliers', 'false').lower() == 'true',
+            include_outlier_count=query.get('include_outlier_count', 'true').lower() == 'true',
+            conclusions=conclusions,
+            exclude_statuses=parse_exclude_statuses_param(query.get('exclude_statuses')),
+        )
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class FilterParams:
+    """Validated repository, date range and filter query parameters shared by the job/step endpoints."""
+    owner: str
+    repo: str
+    workflow_id: str
+    start_date: datetime
+    end_date: datetime
+    conclusions: Optional[tuple[str, ...]]
+    exclude_statuses: tuple[str, ...]
+
+
+def require_filter_params(view):
+    """
+    Decorator that parses and validates the common filter query parameters in one pass.
+
+    owner, repo, workflow_id, start_date and end_date are required. The wrapped view
+    receives them as a ``filters`` keyword argument (FilterParams); invalid requests get
+    a 400 response without calling the view.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        query = request.args
+        owner = query.get('owner')
+        repo = query.get('repo')
+        workflow_id = query.get('workflow_id')
+        start_date_str = query.get('start_date')
+        end_date_str = query.get('end_date')
+
+        if not (owner and repo and workflow_id and start_date_str and end_date_str):
+            return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
+
+        start_date = parse_date(start_date_str)
+        end_date = parse_date(end_date_str)
+
+        if not start_date or not end_date:
+            return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
+
+        try:
+            # Rejected here so a bad filter never reaches the database
+            conclusions = validate_conclusions(parse_conclusions_param(query.get('conclusions')))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        kwargs['filters'] = FilterParams(
+            owner=owner,
+            repo=repo,
+            workflow_id=workflow_id,
+            start_date=start_date,
+            end_date=end_date,
+            conclusions=conclusions,
+            exclude_statuses=parse_exclude_statuses_param(query.get('exclude_statuses')),
+        )
+        return view(*args, **kwargs)
+    return wrapper
+
+def cached_response(view):
+    """
+    Decorator that caches successful, buffered responses in process and makes them conditional.
+
+    Entries are keyed by the request path, the query parameters (sorted, so their order
+    does not matter) and the data version (see get_db_version); the TTL only bounds how
+    long unused entries are kept. The same key yields a weak ETag, so a request whose
+    If-None-Match still matches is answered with a 304 before the view runs. A response
+    is only cached and tagged if the data version did not change while the view ran, so
+    newer data is never stored under an older version. Responses are marked
+    ``Cache-Control: no-cache``: clients may store them but must revalidate, since the
+    dashboard reloads right after a fetch adds data.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        version = get_db_version()
+        key = (request.path, tuple(sorted(request.args.items(multi=True))), version)
+        etag = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            response.cache_control.no_cache = True
+            return response
+
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+        if cached is not None:
+            body, headers = cached
+            response = app.response_class(body, headers=headers)
+            response.headers['X-Cache'] = 'HIT'
+            return response
+
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.cache_control.no_cache = True
+            if get_db_version() == version:
+                response.set_etag(etag, weak=True)
+                if not response.is_streamed:
+                    with _response_cache_lock:
+                        _response_cache[key] = (response.get_data(), list(response.headers))
+        response.headers['X-Cache'] = 'MISS'
+        return response
+    return wrapper
+
+
+def get_db_version() -> int:
+    """
+    Returns the data version, which changes whenever workflow data is written.
+
+    Writes made in this process advance it directly (see database.bump_data_version).
+    Writes from other processes, such as another server worker or ingest.py, show up as
+    a change in this thread's connection's PRAGMA data_version and advance it here. That
+    pragma also moves on rate limit bookkeeping, so those writes invalidate conservatively.
+
+    :return: Monotonic data version of this process
+    """
+    seen = get_db().get_data_version()
+    if getattr(_thread_local, 'data_version_seen', None) != seen:
+        _thread_local.data_version_seen = seen
+        return bump_data_version()
+    return get_data_version()
+
+
+def _cached_trends(params: TrendParams) -> List[Dict[str, Any]]:
+    """
+    Memoized trend computation shared by /api/trends and /api/trends.csv.
+
+    Entries are keyed on the data version (see get_db_version) like cached responses:
+    they expire with the response cache, are all dropped as soon as the version changes,
+    and a result is only stored if the version did not change while it was computed.
+    The returned list is shared between callers and must not be mutated.
+    """
+    global _trends_cache_version
+    db_version = get_db_version()
+    with _trends_cache_lock:
+        # The version only moves forward, so a request that read an older one leaves the cache alone
+        if _trends_cache_version is None or db_version > _trends_cache_version:
+            _trends_cache.clear()
+            _trends_cache_version = db_version
+        trends = _trends_cache.get(params) if _trends_cache_version == db_version else None
+    if trends is not None:
+        return trends
+
+    db = get_db()
+    trends_raw = db.get_time_series_metrics(
+        owner=params.owner, repo=params.repo, workflow_id=params.workflow_id,
+        start_date=params.start_date, end_date=params.end_date, period=params.period,
+        conclusions=list(params.conclusions) if params.conclusions else None,
+        exclude_statuses=list(params.exclude_statuses)
+    )
+
+    trends = compute_trends(trends_raw, params.exclude_outliers, params.include_outlier_count)
+    if get_db_version() == db_version:
+        with _trends_cache_lock:
+            if _trends_cache_version == db_version:
+                _trends_cache[params] = trends
+    return trends
+
+
 @app.route('/')
 def dashboard():
     return render_template('dashboard.html')
@@ -197,7 +637,7 @@ def set_token():
     - 500: Internal error
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False)
         if not data:
             return jsonify({
                 "error": "Request body must be JSON",
@@ -220,16 +660,15 @@ def set_token():
             }), 400
         
         # Validate token format (GitHub tokens start with ghp_, github_pat_, or gho_)
-        if not (token.startswith('ghp_') or token.startswith('github_pat_') or token.startswith('gho_')):
+        if not token.startswith(GITHUB_TOKEN_PREFIXES):
             return jsonify({
                 "error": "Invalid token format. GitHub tokens should start with 'ghp_', 'github_pat_', or 'gho_'",
                 "error_type": "validation"
             }), 400
         
         # Validate token with GitHub API
-        from github_api_client import GitHubApiClient
         try:
-            client = GitHubApiClient(token)
+            client = _get_api_client(token)
             is_valid, error_msg, error_type = client.validate_token()
             
             if not is_valid:
@@ -244,6 +683,10 @@ def set_token():
                 "error_type": "validation"
             }), 400
         
+        # The status endpoint can reuse this check
+        with _token_validation_lock:
+            _token_validation_cache[_token_cache_key(token)] = True
+
         # Store token using ConfigManager
         success = config_manager.set_github_token(token)
         
@@ -264,6 +707,54 @@ def set_token():
             "error_type": "internal"
         }), 500
 
+def _token_cache_key(token: str) -> str:
+    """Returns the key a token's validation result is cached under (the token itself is never stored)."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _get_api_client(token: str) -> GitHubApiClient:
+    """
+    Returns a GitHubApiClient for the token, reusing the previous one (and its HTTPS connection) if possible.
+
+    Clients are not shared between threads; each server or preview pool thread keeps its own.
+
+    :param token: GitHub token
+    :return: GitHubApiClient instance reused by this thread's requests with the same token
+    """
+    key = (threading.get_ident(), _token_cache_key(token))
+    with _api_clients_lock:
+        client = _api_clients.get(key)
+        if client is None:
+            client = _api_clients[key] = GitHubApiClient(token)
+    return client
+
+
+def _is_token_valid(token: str) -> bool:
+    """
+    Checks a GitHub token against the API, reusing results from the last TOKEN_VALIDATION_TTL seconds.
+
+    Results are keyed by a hash of the token, so a changed token is always checked again.
+    Only definite answers are cached; timeouts and connection errors are retried on the next call.
+
+    :param token: GitHub token to validate
+    :return: True if GitHub accepted the token
+    """
+    key = _token_cache_key(token)
+    with _token_validation_lock:
+        valid = _token_validation_cache.get(key)
+    if valid is not None:
+        return valid
+
+    try:
+        valid, _, error_type = _get_api_client(token).validate_token()
+    except Exception:
+        return False
+    if valid or error_type == "authentication":
+        with _token_validation_lock:
+            _token_validation_cache[key] = valid
+    return valid
+
+
 @app.route('/api/config/token/status', methods=['GET'])
 def get_token_status():
     """
@@ -279,18 +770,12 @@ def get_token_status():
         configured = config_manager.is_token_configured()
         source = config_manager.get_token_source()
         
-        # Check if token is valid by attempting to use it
+        # Check if token is valid by attempting to use it (dashboard polls reuse recent results)
         valid = False
         if configured:
             token = config_manager.get_github_token()
             if token:
-                from github_api_client import GitHubApiClient
-                try:
-                    client = GitHubApiClient(token)
-                    is_valid, _, _ = client.validate_token()
-                    valid = is_valid
-                except Exception:
-                    valid = False
+                valid = _is_token_valid(token)
         
         return jsonify({
             "configured": configured,
@@ -402,7 +887,7 @@ def fetch_preview():
     """
     try:
         # Parse request body
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False)
         if not data:
             return jsonify({
                 "error": "Request body must be JSON",
@@ -411,7 +896,7 @@ def fetch_preview():
             }), 400
         
         # Validate parameters using helper function
-        is_valid, error_msg, error_type = validate_fetch_params(data)
+        is_valid, error_msg, error_type, start_date, end_date = validate_fetch_params(data)
         if not is_valid:
             return jsonify({
                 "error": error_msg,
@@ -423,8 +908,6 @@ def fetch_preview():
         owner = data['owner'].strip()
         repo = data['repo'].strip()
         workflow_id = data['workflow_id'].strip()
-        start_date = datetime.fromisoformat(data['start_date'].replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(data['end_date'].replace('Z', '+00:00'))
         
         # Check for GitHub token using ConfigManager
         token = config_manager.get_github_token()
@@ -436,10 +919,8 @@ def fetch_preview():
             }), 401
         
         # Query GitHub API for a quick preview estimate
-        from github_api_client import GitHubApiClient
-        
         try:
-            client = GitHubApiClient(token)
+            client = _get_api_client(token)
             
             # Validate token before proceeding
             is_valid, error_msg, error_type = client.validate_token()
@@ -451,39 +932,30 @@ def fetch_preview():
                     "details": error_msg
                 }), status_code
             
-            # For preview, do a quick sample to estimate total count
-            # Sample the first week and extrapolate
-            sample_end = min(start_date + timedelta(days=7), end_date)
-            total_days = (end_date - start_date).days
-            sample_days = (sample_end - start_date).days
+            # For preview, count the runs in a few sample windows (fetched concurrently,
+            # since each is a round trip to GitHub) and extrapolate to the whole range.
+            # Each pool thread reuses its own cached client, and so its own keep-alive session
+            windows, covers_range = _preview_sample_windows(start_date, end_date)
+            sample_counts = list(_get_preview_executor().map(
+                lambda window: len(_get_api_client(token).get_workflow_runs(
+                    owner=owner,
+                    repo=repo,
+                    workflow_id=workflow_id,
+                    created_after=window[0],
+                    created_before=window[1]
+                )),
+                windows
+            ))
+            sample_count = sum(sample_counts)
             
-            if sample_days == 0:
-                sample_days = 1
-            
-            # Fetch sample week
-            created_after = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-            created_before = sample_end.strftime('%Y-%m-%dT%H:%M:%SZ')
-            
-            sample_runs = client.get_workflow_runs(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                created_after=created_after,
-                created_before=created_before
-            )
-            
-            sample_count = len(sample_runs)
-            
-            # If sample is less than 1000, we got all runs for that period
-            # Extrapolate to estimate total
-            if sample_count < 1000:
-                # Simple extrapolation based on sample
-                estimated_count = int((sample_count / sample_days) * total_days)
-                is_estimate = total_days > sample_days
+            # A window that hit GitHub's result limit only gives a lower bound for its period
+            hit_limit = any(count >= GITHUB_RUNS_RESULT_LIMIT for count in sample_counts)
+            if covers_range:
+                estimated_count = sample_count
+                is_estimate = hit_limit
             else:
-                # Sample hit the limit, so we know there are at least this many
-                # Extrapolate but mark as minimum estimate
-                estimated_count = int((1000 / sample_days) * total_days)
+                sample_span = timedelta(days=PREVIEW_SAMPLE_DAYS) * len(windows)
+                estimated_count = int(sample_count * ((end_date - start_date) / sample_span))
                 is_estimate = True
             
             response = {
@@ -496,7 +968,10 @@ def fetch_preview():
             }
             
             if is_estimate:
-                response["note"] = f"Estimated based on {sample_days}-day sample. Actual fetch will count all workflows accurately."
+                if covers_range:
+                    response["note"] = f"GitHub returned at most {GITHUB_RUNS_RESULT_LIMIT} runs for part of this range, so the count is a minimum. Actual fetch will count all workflows accurately."
+                else:
+                    response["note"] = f"Estimated based on {len(windows)} {PREVIEW_SAMPLE_DAYS}-day samples across the range. Actual fetch will count all workflows accurately."
             
             return jsonify(response)
             
@@ -555,7 +1030,7 @@ def fetch_start():
     """
     try:
         # Parse request body
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False)
         if not data:
             return jsonify({
                 "error": "Request body must be JSON",
@@ -564,7 +1039,7 @@ def fetch_start():
             }), 400
         
         # Validate parameters using helper function
-        is_valid, error_msg, error_type = validate_fetch_params(data)
+        is_valid, error_msg, error_type, start_date, end_date = validate_fetch_params(data)
         if not is_valid:
             return jsonify({
                 "error": error_msg,
@@ -580,10 +1055,6 @@ def fetch_start():
         end_date_str = data['end_date']
         skip_incomplete = data.get('skip_incomplete', False)
         
-        # Parse dates (already validated)
-        start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-        
         # Create task configuration
         config = {
             'owner': owner,
@@ -597,13 +1068,11 @@ def fetch_start():
         # Create task in task manager
         task_id = task_manager.create_task(config)
         
-        # Start background thread to execute fetch
-        thread = threading.Thread(
-            target=execute_fetch_task,
-            args=(task_manager, task_id, owner, repo, workflow_id, start_date, end_date, DB_PATH, skip_incomplete, config_manager),
-            daemon=True
+        # Queue the fetch on the bounded background pool
+        _get_fetch_executor().submit(
+            execute_fetch_task,
+            task_manager, task_id, owner, repo, workflow_id, start_date, end_date, DB_PATH, skip_incomplete, config_manager
         )
-        thread.start()
         
         return jsonify({
             "task_id": task_id,
@@ -666,7 +1135,64 @@ def fetch_status(task_id):
             "details": str(e)
         }), 500
 
+@app.route('/api/fetch/status/<task_id>/stream', methods=['GET'])
+def fetch_status_stream(task_id):
+    """
+    API endpoint that pushes the status of a background fetch task as Server-Sent Events.
+    
+    Each event's data is the same JSON object /api/fetch/status/<task_id> returns. An event
+    is sent right away and then whenever the task changes; the stream ends after the task
+    completes or fails. A keep-alive comment is sent after FETCH_STATUS_HEARTBEAT seconds
+    without changes.
+    
+    An open stream occupies a server thread until it ends, so at most FETCH_STATUS_MAX_STREAMS
+    are served at once; past that the request is refused with 503 and the dashboard falls back
+    to polling /api/fetch/status/<task_id>.
+    
+    Path Parameters:
+    - task_id (str): Unique task identifier returned by /api/fetch/start
+    
+    Error Responses:
+    - 404: Task ID not found
+    - 503: Too many open status streams
+    """
+    status = task_manager.get_task_status(task_id)
+    if status is None:
+        return jsonify({
+            "error": "Task not found",
+            "error_type": "not_found",
+            "details": f"No task found with ID: {task_id}"
+        }), 404
+    
+    def events(status):
+        sent = None
+        while status is not None:
+            if status == sent:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {app.json.dumps(status)}\n\n"
+                if status['status'] in ('completed', 'failed'):
+                    return
+                sent = status
+            status = task_manager.wait_for_update(task_id, sent, timeout=FETCH_STATUS_HEARTBEAT)
+    
+    if not _fetch_status_streams.acquire(blocking=False):
+        return jsonify({
+            "error": "Too many status streams",
+            "error_type": "unavailable",
+            "details": f"At most {FETCH_STATUS_MAX_STREAMS} status streams can be open; poll /api/fetch/status/{task_id} instead"
+        }), 503
+    
+    response = Response(events(status), mimetype='text/event-stream')
+    # Runs when the stream ends or the client disconnects
+    response.call_on_close(_fetch_status_streams.release)
+    response.cache_control.no_cache = True
+    # Ask reverse proxies not to buffer the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/overall-metrics', methods=['GET'])
+@cached_response
 def get_overall_metrics():
     """
     API endpoint to get overall metrics including job-based P95 duration.
@@ -704,54 +1230,37 @@ def get_overall_metrics():
     exclude_statuses = exclude_statuses_str.split(',') if exclude_statuses_str else DEFAULT_EXCLUDE_STATUSES
     
     try:
-        with get_db() as db:
-            # Get total runs and successful runs
-            workflows = db.get_workflow_runs(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-            
-            total_runs = len(workflows)
-            successful_runs = sum(1 for w in workflows if w.get('conclusion') == 'success')
-            success_rate = (successful_runs / total_runs * 100.0) if total_runs > 0 else 0.0
-            
-            # Get job-based durations for successful runs only
-            job_based_durations = db.get_workflow_job_based_durations(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=['success'],
-                exclude_statuses=exclude_statuses
-            )
-            
-            # Calculate P95 from job-based durations
-            p95_duration_ms = None
-            if len(job_based_durations) > 0:
-                p95 = np.percentile(job_based_durations, 95)
-                p95_duration_ms = int(p95)
-            
-            return jsonify({
-                "total_runs": total_runs,
-                "successful_runs": successful_runs,
-                "success_rate": round(success_rate, 1),
-                "p95_duration_ms": p95_duration_ms,
-                "metadata": {
-                    "calculation_method": "job_based",
-                    "calculation_description": "P95 duration calculated from maximum job duration per workflow"
-                }
-            })
+        db = get_db()
+        # Run counts and the P95 of the job-based durations of successful runs, in one SQL scan
+        total_runs, successful_runs, p95 = db.get_overall_run_metrics(
+            owner=owner,
+            repo=repo,
+            workflow_id=workflow_id,
+            q=0.95,
+            start_date=start_date,
+            end_date=end_date,
+            conclusions=conclusions,
+            exclude_statuses=exclude_statuses
+        )
+        success_rate = (successful_runs / total_runs * 100.0) if total_runs > 0 else 0.0
+        p95_duration_ms = int(p95) if p95 is not None else None
+
+        return jsonify({
+            "total_runs": total_runs,
+            "successful_runs": successful_runs,
+            "success_rate": round(success_rate, 1),
+            "p95_duration_ms": p95_duration_ms,
+            "metadata": {
+                "calculation_method": "job_based",
+                "calculation_description": "P95 duration calculated from maximum job duration per workflow"
+            }
+        })
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/workflows', methods=['GET'])
+@cached_response
 def get_workflows():
     """
     API endpoint to get detailed workflow run data.
@@ -768,7 +1277,7 @@ def get_workflows():
     repo = request.args.get('repo')
     workflow_id = request.args.get('workflow_id')
 
-    if not all([owner, repo, workflow_id]):
+    if not (owner and repo and workflow_id):
         return jsonify({"error": "Missing required parameters: owner, repo, workflow_id"}), 400
 
     start_date = parse_date(request.args.get('start_date'))
@@ -777,16 +1286,18 @@ def get_workflows():
     exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
 
     try:
-        with get_db() as db:
-            runs = db.get_workflow_runs(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
+        db = get_db()
+        # Read in full before responding, so the cursor (and its read lock) does not outlive the view
+        runs = list(db.iter_workflow_runs(
+            owner=owner,
+            repo=repo,
+            workflow_id=workflow_id,
+            start_date=start_date,
+            end_date=end_date,
+            conclusions=conclusions,
+            exclude_statuses=exclude_statuses,
+            as_json=True
+        ))
         
         # Handle empty result sets with informative metadata
         if not runs:
@@ -799,7 +1310,7 @@ def get_workflows():
                 }
             }), 200
         
-        return jsonify(runs)
+        return Response(_json_array(runs), mimetype=app.json.mimetype)
     except ValueError as e:
         # Handle invalid filter parameters
         return jsonify({"error": str(e)}), 400
@@ -808,7 +1319,9 @@ def get_workflows():
 
 
 @app.route('/api/trends', methods=['GET'])
-def get_trends():
+@cached_response
+@require_trend_params
+def get_trends(params: TrendParams):
     """
     API endpoint to get time-series trend data for workflow runs.
     Query Parameters:
@@ -819,93 +1332,16 @@ def get_trends():
     - end_date (str, optional): ISO 8601 format.
     - period (str, optional): 'day' or 'week'. Defaults to 'day'.
     - exclude_outliers (bool, optional): If true, exclude outliers from percentile and average success duration calculations.
+    - include_outlier_count (bool, optional): Defaults to true. If false (and exclude_outliers is false),
+      the IQR outlier detection is skipped and outlier_count is null.
     - conclusions (str, optional): Comma-separated list of conclusion values to filter by (e.g., 'success,failure').
     - exclude_statuses (str, optional): Comma-separated list of statuses to exclude (default: 'in_progress,queued').
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-
-    if not all([owner, repo, workflow_id]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id"}), 400
-
-    start_date = parse_date(request.args.get('start_date'))
-    end_date = parse_date(request.args.get('end_date'))
-    period = request.args.get('period', 'day')
-    exclude_outliers = request.args.get('exclude_outliers', 'false').lower() == 'true'
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-
-    if period not in ['day', 'week']:
-        return jsonify({"error": "Invalid 'period' parameter. Must be 'day' or 'week'."}), 400
-
     try:
-        with get_db() as db:
-            trends_raw = db.get_time_series_metrics(
-                owner=owner, repo=repo, workflow_id=workflow_id,
-                start_date=start_date, end_date=end_date, period=period,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-
-        trends = []
-        for period_data in trends_raw:
-            data = dict(period_data)  # Make a mutable copy
-            success_durations_str = data.pop('success_durations_ms_list', None)
-            all_durations_str = data.pop('all_durations_ms_list', None)
-
-            p50 = p95 = p99 = None
-            outlier_count = 0
-
-            # Recalculate overall average duration if outliers are excluded
-            if exclude_outliers and all_durations_str:
-                all_durations = np.array([int(d) for d in all_durations_str.split(',') if d])
-                if len(all_durations) > 1:
-                    p25, p75 = np.percentile(all_durations, [25, 75])
-                    iqr = p75 - p25
-                    lower_bound = p25 - (1.5 * iqr)
-                    upper_bound = p75 + (1.5 * iqr)
-                    outliers_mask = (all_durations < lower_bound) | (all_durations > upper_bound)
-
-                    filtered_durations = all_durations[~outliers_mask]
-                    if len(filtered_durations) > 0:
-                        data['avg_duration_ms'] = np.mean(filtered_durations)
-                    else:
-                        data['avg_duration_ms'] = None
-
-            # The rest of the logic is for successful runs (percentiles, success average, outlier count)
-            if success_durations_str:
-                durations = np.array([int(d) for d in success_durations_str.split(',') if d])
-
-                if len(durations) > 1:
-                    # Calculate outliers based on original data before filtering
-                    p25, p75 = np.percentile(durations, [25, 75])
-                    iqr = p75 - p25
-                    lower_bound = p25 - (1.5 * iqr)
-                    upper_bound = p75 + (1.5 * iqr)
-                    outliers_mask = (durations < lower_bound) | (durations > upper_bound)
-                    outlier_count = int(np.sum(outliers_mask))
-
-                    if exclude_outliers:
-                        durations = durations[~outliers_mask]
-                        # Recalculate average success duration if outliers are excluded
-                        if len(durations) > 0:
-                            data['avg_success_duration_ms'] = np.mean(durations)
-                        else:
-                            data['avg_success_duration_ms'] = None
-
-                if len(durations) > 0:
-                    p50, p95, p99 = np.percentile(durations, [50, 95, 99])
-
-            data['p50_duration_ms'] = int(p50) if p50 is not None else None
-            data['p95_duration_ms'] = int(p95) if p95 is not None else None
-            data['p99_duration_ms'] = int(p99) if p99 is not None else None
-            data['outlier_count'] = outlier_count
-
-            trends.append(data)
+        trends = _cached_trends(params)
 
         # Include filter metadata in response
-        metadata = build_filter_metadata(conclusions, exclude_statuses)
+        metadata = build_filter_metadata(params.conclusions, params.exclude_statuses)
         
         # Add calculation method metadata
         metadata["calculation_method"] = "job_based"
@@ -927,7 +1363,9 @@ def get_trends():
 
 
 @app.route('/api/jobs', methods=['GET'])
-def get_job_metrics():
+@cached_response
+@require_filter_params
+def get_job_metrics(filters: FilterParams):
     """
     API endpoint to get aggregated metrics per job name for a given workflow.
     Query Parameters:
@@ -939,32 +1377,14 @@ def get_job_metrics():
     - conclusions (str, optional): Comma-separated list of conclusion values to filter by (e.g., 'success,failure').
     - exclude_statuses (str, optional): Comma-separated list of statuses to exclude (default: 'in_progress,queued').
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
-
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
-
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-
     try:
-        with get_db() as db:
-            raw_metrics = db.get_job_metrics(
-                owner=owner, repo=repo, workflow_id=workflow_id,
-                start_date=start_date, end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
+        db = get_db()
+        raw_metrics = db.get_job_metrics(
+            owner=filters.owner, repo=filters.repo, workflow_id=filters.workflow_id,
+            start_date=filters.start_date, end_date=filters.end_date,
+            conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses
+        )
 
         results = []
         for job_data in raw_metrics:
@@ -973,24 +1393,16 @@ def get_job_metrics():
 
             success_rate = (successful_runs / total_runs * 100.0) if total_runs > 0 else 0.0
 
-            p95_duration_ms = None
-            durations_str = job_data.get('success_durations_ms_list')
-            if durations_str:
-                durations = np.array([int(d) for d in durations_str.split(',') if d])
-                if len(durations) > 0:
-                    p95 = np.percentile(durations, 95)
-                    p95_duration_ms = int(p95)
-
             results.append({
                 "job_name": job_data['job_name'],
                 "total_runs": total_runs,
                 "success_rate": round(success_rate, 1),
-                "p95_duration_ms": p95_duration_ms
+                "p95_duration_ms": job_data['p95_duration_ms']
             })
 
         # Handle empty result sets with informative metadata
         if not results:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
@@ -1008,91 +1420,15 @@ def get_job_metrics():
 
 
 @app.route('/api/trends.csv', methods=['GET'])
-def get_trends_csv():
+@cached_response
+@require_trend_params
+def get_trends_csv(params: TrendParams):
     """
     API endpoint to get time-series trend data as a CSV file.
     Query Parameters are the same as /api/trends.
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-
-    if not all([owner, repo, workflow_id]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id"}), 400
-
-    start_date = parse_date(request.args.get('start_date'))
-    end_date = parse_date(request.args.get('end_date'))
-    period = request.args.get('period', 'day')
-    exclude_outliers = request.args.get('exclude_outliers', 'false').lower() == 'true'
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-
-    if period not in ['day', 'week']:
-        return jsonify({"error": "Invalid 'period' parameter. Must be 'day' or 'week'."}), 400
-
     try:
-        with get_db() as db:
-            trends_raw = db.get_time_series_metrics(
-                owner=owner, repo=repo, workflow_id=workflow_id,
-                start_date=start_date, end_date=end_date, period=period,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-
-        trends = []
-        for period_data in trends_raw:
-            data = dict(period_data)  # Make a mutable copy
-            success_durations_str = data.pop('success_durations_ms_list', None)
-            all_durations_str = data.pop('all_durations_ms_list', None)
-
-            p50 = p95 = p99 = None
-            outlier_count = 0
-
-            # Recalculate overall average duration if outliers are excluded
-            if exclude_outliers and all_durations_str:
-                all_durations = np.array([int(d) for d in all_durations_str.split(',') if d])
-                if len(all_durations) > 1:
-                    p25, p75 = np.percentile(all_durations, [25, 75])
-                    iqr = p75 - p25
-                    lower_bound = p25 - (1.5 * iqr)
-                    upper_bound = p75 + (1.5 * iqr)
-                    outliers_mask = (all_durations < lower_bound) | (all_durations > upper_bound)
-
-                    filtered_durations = all_durations[~outliers_mask]
-                    if len(filtered_durations) > 0:
-                        data['avg_duration_ms'] = np.mean(filtered_durations)
-                    else:
-                        data['avg_duration_ms'] = None
-
-            # The rest of the logic is for successful runs (percentiles, success average, outlier count)
-            if success_durations_str:
-                durations = np.array([int(d) for d in success_durations_str.split(',') if d])
-
-                if len(durations) > 1:
-                    # Calculate outliers based on original data before filtering
-                    p25, p75 = np.percentile(durations, [25, 75])
-                    iqr = p75 - p25
-                    lower_bound = p25 - (1.5 * iqr)
-                    upper_bound = p75 + (1.5 * iqr)
-                    outliers_mask = (durations < lower_bound) | (durations > upper_bound)
-                    outlier_count = int(np.sum(outliers_mask))
-
-                    if exclude_outliers:
-                        durations = durations[~outliers_mask]
-                        if len(durations) > 0:
-                            data['avg_success_duration_ms'] = np.mean(durations)
-                        else:
-                            data['avg_success_duration_ms'] = None
-
-                if len(durations) > 0:
-                    p50, p95, p99 = np.percentile(durations, [50, 95, 99])
-
-            data['p50_duration_ms'] = int(p50) if p50 is not None else None
-            data['p95_duration_ms'] = int(p95) if p95 is not None else None
-            data['p99_duration_ms'] = int(p99) if p99 is not None else None
-            data['outlier_count'] = outlier_count
-
-            trends.append(data)
+        trends = _cached_trends(params)
 
         # Handle empty result sets
         if not trends:
@@ -1100,26 +1436,25 @@ def get_trends_csv():
 
         # Build filter metadata for CSV header
         filter_metadata = {
-            "owner": owner,
-            "repo": repo,
-            "workflow_id": workflow_id,
+            "owner": params.owner,
+            "repo": params.repo,
+            "workflow_id": params.workflow_id,
             "calculation_method": "job_based",
             "calculation_description": "Duration metrics calculated from maximum job duration per workflow, excluding idle time between re-runs",
             "filters_applied": {
-                "conclusions": conclusions if conclusions else [],
-                "excluded_statuses": exclude_statuses if exclude_statuses else [],
+                "conclusions": params.conclusions if params.conclusions else [],
+                "excluded_statuses": params.exclude_statuses if params.exclude_statuses else [],
             },
             "time_range": {
-                "start_date": start_date.isoformat() if start_date else None,
-                "end_date": end_date.isoformat() if end_date else None
+                "start_date": params.start_date.isoformat() if params.start_date else None,
+                "end_date": params.end_date.isoformat() if params.end_date else None
             }
         }
 
         exporter = ReportExporter()
-        csv_string = exporter.export_to_csv_string(trends, filter_metadata)
 
         return Response(
-            csv_string,
+            exporter.iter_csv_chunks(trends, filter_metadata),
             mimetype="text/csv",
             headers={"Content-disposition": "attachment; filename=trends.csv"}
         )
@@ -1131,7 +1466,9 @@ def get_trends_csv():
 
 
 @app.route('/api/jobs/slowest', methods=['GET'])
-def get_slowest_jobs():
+@cached_response
+@require_filter_params
+def get_slowest_jobs(filters: FilterParams):
     """
     API endpoint to get the slowest jobs by P95 duration.
     Query Parameters:
@@ -1144,33 +1481,16 @@ def get_slowest_jobs():
     - conclusions (str, optional): Comma-separated list of conclusion values.
     - exclude_statuses (str, optional): Comma-separated list of statuses to exclude (default: 'in_progress,queued').
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
     limit = int(request.args.get('limit', 10))
 
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
-
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-
     try:
-        with get_db() as db:
-            raw_metrics = db.get_slowest_jobs(
-                owner=owner, repo=repo, workflow_id=workflow_id,
-                start_date=start_date, end_date=end_date,
-                limit=limit, conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
+        db = get_db()
+        raw_metrics = db.get_slowest_jobs(
+            owner=filters.owner, repo=filters.repo, workflow_id=filters.workflow_id,
+            start_date=filters.start_date, end_date=filters.end_date,
+            limit=limit, conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses
+        )
 
         results = []
         for job_data in raw_metrics:
@@ -1180,25 +1500,18 @@ def get_slowest_jobs():
             success_rate = (successful_runs / total_runs * 100.0) if total_runs > 0 else 0.0
 
             avg_duration_ms = job_data.get('avg_success_duration_ms')
-            p95_duration_ms = None
-            durations_str = job_data.get('success_durations_ms_list')
-            if durations_str:
-                durations = np.array([int(d) for d in durations_str.split(',') if d])
-                if len(durations) > 0:
-                    p95 = np.percentile(durations, 95)
-                    p95_duration_ms = int(p95)
 
             results.append({
                 "job_name": job_data['job_name'],
                 "total_runs": total_runs,
                 "success_rate": round(success_rate, 1),
                 "avg_duration_ms": int(avg_duration_ms) if avg_duration_ms else None,
-                "p95_duration_ms": p95_duration_ms
+                "p95_duration_ms": job_data['p95_duration_ms']
             })
 
         # Handle empty result sets with informative metadata
         if not results:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
@@ -1216,7 +1529,9 @@ def get_slowest_jobs():
 
 
 @app.route('/api/steps', methods=['GET'])
-def get_steps():
+@cached_response
+@require_filter_params
+def get_steps(filters: FilterParams):
     """
     API endpoint to get step metrics, optionally filtered by job.
     Query Parameters:
@@ -1230,43 +1545,26 @@ def get_steps():
     - conclusions (str, optional): Comma-separated list of conclusion values.
     - exclude_statuses (str, optional): Comma-separated list of statuses to exclude (default: 'in_progress,queued').
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
     job_name = request.args.get('job_name')
     limit = request.args.get('limit')
 
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
-
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-
     try:
-        with get_db() as db:
-            if limit:
-                raw_metrics = db.get_slowest_steps(
-                    owner=owner, repo=repo, workflow_id=workflow_id,
-                    start_date=start_date, end_date=end_date,
-                    job_name=job_name, limit=int(limit),
-                    conclusions=conclusions,
-                    exclude_statuses=exclude_statuses
-                )
-            else:
-                raw_metrics = db.get_step_metrics(
-                    owner=owner, repo=repo, workflow_id=workflow_id,
-                    start_date=start_date, end_date=end_date,
-                    job_name=job_name, conclusions=conclusions,
-                    exclude_statuses=exclude_statuses
-                )
+        db = get_db()
+        if limit:
+            raw_metrics = db.get_slowest_steps(
+                owner=filters.owner, repo=filters.repo, workflow_id=filters.workflow_id,
+                start_date=filters.start_date, end_date=filters.end_date,
+                job_name=job_name, limit=int(limit),
+                conclusions=filters.conclusions,
+                exclude_statuses=filters.exclude_statuses
+            )
+        else:
+            raw_metrics = db.get_step_metrics(
+                owner=filters.owner, repo=filters.repo, workflow_id=filters.workflow_id,
+                start_date=filters.start_date, end_date=filters.end_date,
+                job_name=job_name, conclusions=filters.conclusions,
+                exclude_statuses=filters.exclude_statuses
+            )
 
         results = []
         for step_data in raw_metrics:
@@ -1277,13 +1575,6 @@ def get_steps():
 
             avg_duration_ms = step_data.get('avg_duration_ms')
             avg_success_duration_ms = step_data.get('avg_success_duration_ms')
-            p95_duration_ms = None
-            durations_str = step_data.get('success_durations_ms_list')
-            if durations_str:
-                durations = np.array([int(d) for d in durations_str.split(',') if d])
-                if len(durations) > 0:
-                    p95 = np.percentile(durations, 95)
-                    p95_duration_ms = int(p95)
 
             results.append({
                 "step_name": step_data['step_name'],
@@ -1292,12 +1583,12 @@ def get_steps():
                 "success_rate": round(success_rate, 1),
                 "avg_duration_ms": int(avg_duration_ms) if avg_duration_ms else None,
                 "avg_success_duration_ms": int(avg_success_duration_ms) if avg_success_duration_ms else None,
-                "p95_duration_ms": p95_duration_ms
+                "p95_duration_ms": step_data['p95_duration_ms']
             })
 
         # Handle empty result sets with informative metadata
         if not results:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
@@ -1315,7 +1606,9 @@ def get_steps():
 
 
 @app.route('/api/jobs/<job_name>/trends', methods=['GET'])
-def get_job_trends(job_name):
+@cached_response
+@require_filter_params
+def get_job_trends(job_name, filters: FilterParams):
     """
     API endpoint to get time-series trend data for a specific job.
     Query Parameters:
@@ -1328,58 +1621,25 @@ def get_job_trends(job_name):
     - conclusions (str, optional): Comma-separated list of conclusion values.
     - exclude_statuses (str, optional): Comma-separated list of statuses to exclude (default: 'in_progress,queued').
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
     period = request.args.get('period', 'day')
-
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
-
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
     
     if period not in ['day', 'week']:
         return jsonify({"error": "Invalid 'period' parameter. Must be 'day' or 'week'."}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
 
     try:
-        with get_db() as db:
-            trends_raw = db.get_job_time_series(
-                owner=owner, repo=repo, workflow_id=workflow_id,
-                job_name=job_name,
-                start_date=start_date, end_date=end_date,
-                period=period, conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-
-        trends = []
-        for period_data in trends_raw:
-            data = dict(period_data)
-            success_durations_str = data.pop('success_durations_ms_list', None)
-
-            p50 = p95 = p99 = None
-            if success_durations_str:
-                durations = np.array([int(d) for d in success_durations_str.split(',') if d])
-                if len(durations) > 0:
-                    p50, p95, p99 = np.percentile(durations, [50, 95, 99])
-
-            data['p50_duration_ms'] = int(p50) if p50 is not None else None
-            data['p95_duration_ms'] = int(p95) if p95 is not None else None
-            data['p99_duration_ms'] = int(p99) if p99 is not None else None
-
-            trends.append(data)
+        db = get_db()
+        # p50/p95/p99 are computed in SQL by the percentile() aggregate
+        trends = db.get_job_time_series(
+            owner=filters.owner, repo=filters.repo, workflow_id=filters.workflow_id,
+            job_name=job_name,
+            start_date=filters.start_date, end_date=filters.end_date,
+            period=period, conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses
+        )
 
         # Handle empty result sets with informative metadata
         if not trends:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
@@ -1397,7 +1657,9 @@ def get_job_trends(job_name):
 
 
 @app.route('/api/jobs/<job_name>/executions', methods=['GET'])
-def get_job_executions(job_name):
+@cached_response
+@require_filter_params
+def get_job_executions(job_name, filters: FilterParams):
     """
     API endpoint to get individual job executions with GitHub links.
     
@@ -1429,22 +1691,8 @@ def get_job_executions(job_name):
       ...
     ]
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
     limit_str = request.args.get('limit')
     order_by = request.args.get('order_by', 'duration_desc')
-
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
-
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
     
     # Parse limit parameter
     limit = None
@@ -1457,44 +1705,31 @@ def get_job_executions(job_name):
             return jsonify({"error": "Invalid limit parameter. Must be an integer."}), 400
     
     # Validate order_by parameter
-    valid_order_by = ['duration_desc', 'duration_asc', 'created_desc', 'created_asc']
-    if order_by not in valid_order_by:
-        return jsonify({"error": f"Invalid order_by parameter. Must be one of: {', '.join(valid_order_by)}"}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
+    if order_by not in JOB_EXECUTION_ORDER_BY:
+        return jsonify({"error": f"Invalid order_by parameter. Must be one of: {', '.join(JOB_EXECUTION_ORDER_BY)}"}), 400
 
     try:
-        with get_db() as db:
-            executions = db.get_job_executions_with_details(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                job_name=job_name,
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses,
-                limit=limit,
-                order_by=order_by
-            )
-        
-        # Generate GitHub URLs for each execution
-        results = []
-        for execution in executions:
-            result = dict(execution)
-            # Generate GitHub URL
-            result['github_url'] = generate_github_job_url(
-                result['owner'],
-                result['repo'],
-                result['workflow_run_id'],
-                result['job_id']
-            )
-            results.append(result)
+        db = get_db()
+        # Rows come back as JSON objects encoded by SQLite, GitHub job URL included. They are
+        # all read before responding: streaming from the cursor would hold the connection's
+        # read lock, and so block a fetch's commit, for as long as a slow client takes
+        rows = list(db.iter_job_executions_with_details(
+            owner=filters.owner,
+            repo=filters.repo,
+            workflow_id=filters.workflow_id,
+            job_name=job_name,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses,
+            limit=limit,
+            order_by=order_by,
+            as_json=True
+        ))
         
         # Handle empty result sets with informative metadata
-        if not results:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+        if not rows:
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
@@ -1503,7 +1738,7 @@ def get_job_executions(job_name):
                 }
             }), 200
         
-        return jsonify(results)
+        return Response(_json_array(rows), mimetype=app.json.mimetype)
     except ValueError as e:
         # Handle validation errors (e.g., invalid conclusions)
         return jsonify({"error": str(e)}), 400
@@ -1512,7 +1747,9 @@ def get_job_executions(job_name):
 
 
 @app.route('/api/jobs/<job_name>/build-steps', methods=['GET'])
-def get_job_build_steps(job_name):
+@cached_response
+@require_filter_params
+def get_job_build_steps(job_name, filters: FilterParams):
     """
     API endpoint to get aggregated build step metrics for REPL Tests jobs.
     
@@ -1550,112 +1787,62 @@ def get_job_build_steps(job_name):
       }
     ]
     """
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
+    try:
+        db = get_db()
+        # Query for both legacy "Build apps" and new "Build linux-x64-%" patterns at once;
+        # analyze_repl_build_steps then works out which one each run uses
+        all_steps = db.get_step_metrics_with_patterns(
+            owner=filters.owner,
+            repo=filters.repo,
+            workflow_id=filters.workflow_id,
+            job_name=job_name,
+            step_patterns=['Build apps', 'Build linux-x64-%'],
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses
+        )
 
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({"error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"}), 400
+        # Rows come ordered by created_at descending and then by run, so each run's steps are
+        # contiguous and runs are seen most recent first, as the response requires
+        results = []
+        for run_id, run_rows in itertools.groupby(all_steps, key=operator.itemgetter('workflow_run_id')):
+            steps = list(run_rows)
+            created_at = steps[0]['created_at']
+            # The database returns one fresh dict per row, so each is reused as the step dict:
+            # analyze_repl_build_steps reads 'name', and the response wants the same fields
+            # minus the run columns
+            for step in steps:
+                del step['workflow_run_id'], step['created_at']
+                step['name'] = step.pop('step_name')
+
+            analysis = analyze_repl_build_steps(steps)
+
+            # Format build_steps for response
+            formatted_steps = analysis['build_steps']
+            for step in formatted_steps:
+                step['step_name'] = step.pop('name')
 
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
+            results.append({
+                'workflow_run_id': run_id,
+                'created_at': created_at,
+                'build_type': analysis['build_type'],
+                'total_build_duration_ms': analysis['total_build_duration_ms'],
+                'build_steps': formatted_steps
+            })
 
-    if not start_date or not end_date:
-        return jsonify({"error": "Invalid date format. Please use ISO 8601 format."}), 400
-    
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
+        # Handle empty result sets with informative metadata
+        if not results:
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
+            return jsonify({
+                "data": [],
+                "metadata": {
+                    **metadata,
+                    "message": f"No build steps found for '{job_name}' matching the specified filters"
+                }
+            }), 200
 
-    try:
-        with get_db() as db:
-            # Query for both legacy "Build apps" and new "Build linux-x64-%" patterns
-            # We'll query all steps and then filter/analyze them
-            legacy_steps = db.get_step_metrics_with_pattern(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                job_name=job_name,
-                step_pattern='Build apps',
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-            
-            new_pattern_steps = db.get_step_metrics_with_pattern(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                job_name=job_name,
-                step_pattern='Build linux-x64-%',
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
-            
-            # Combine all steps
-            all_steps = legacy_steps + new_pattern_steps
-            
-            # Group steps by workflow_run_id
-            workflow_runs = {}
-            for step in all_steps:
-                run_id = step['workflow_run_id']
-                if run_id not in workflow_runs:
-                    workflow_runs[run_id] = {
-                        'workflow_run_id': run_id,
-                        'created_at': step['created_at'],
-                        'steps': []
-                    }
-                workflow_runs[run_id]['steps'].append({
-                    'name': step['step_name'],
-                    'duration_ms': step['duration_ms'],
-                    'step_conclusion': step['step_conclusion'],
-                    'step_started_at': step['step_started_at'],
-                    'step_completed_at': step['step_completed_at']
-                })
-            
-            # Analyze each workflow run's build steps
-            results = []
-            for run_id, run_data in workflow_runs.items():
-                analysis = analyze_repl_build_steps(run_data['steps'])
-                
-                # Format build_steps for response
-                formatted_steps = []
-                for step in analysis['build_steps']:
-                    formatted_steps.append({
-                        'step_name': step['name'],
-                        'duration_ms': step['duration_ms'],
-                        'step_conclusion': step.get('step_conclusion'),
-                        'step_started_at': step.get('step_started_at'),
-                        'step_completed_at': step.get('step_completed_at')
-                    })
-                
-                results.append({
-                    'workflow_run_id': run_data['workflow_run_id'],
-                    'created_at': run_data['created_at'],
-                    'build_type': analysis['build_type'],
-                    'total_build_duration_ms': analysis['total_build_duration_ms'],
-                    'build_steps': formatted_steps
-                })
-            
-            # Sort by created_at descending (most recent first)
-            results.sort(key=lambda x: x['created_at'], reverse=True)
-            
-            # Handle empty result sets with informative metadata
-            if not results:
-                metadata = build_filter_metadata(conclusions, exclude_statuses)
-                return jsonify({
-                    "data": [],
-                    "metadata": {
-                        **metadata,
-                        "message": f"No build steps found for '{job_name}' matching the specified filters"
-                    }
-                }), 200
-            
-            return jsonify(results)
+        return jsonify(results)
     except ValueError as e:
         # Handle validation errors (e.g., invalid conclusions)
         return jsonify({"error": str(e)}), 400
@@ -1664,7 +1851,9 @@ def get_job_build_steps(job_name):
 
 
 @app.route('/api/jobs/flakiest', methods=['GET'])
-def get_flakiest_jobs():
+@cached_response
+@require_filter_params
+def get_flakiest_jobs(filters: FilterParams):
     debug_log_path = os.path.join(os.path.dirname(__file__), 'data', 'debug.log')
     with open(debug_log_path, "a") as f:
         f.write("DEBUG: get_flakiest_jobs CALLED!\n")
@@ -1705,27 +1894,6 @@ def get_flakiest_jobs():
       }
     ]
     """
-    # Parse and validate required parameters
-    owner = request.args.get('owner')
-    repo = request.args.get('repo')
-    workflow_id = request.args.get('workflow_id')
-    start_date_str = request.args.get('start_date')
-    end_date_str = request.args.get('end_date')
-    
-    if not all([owner, repo, workflow_id, start_date_str, end_date_str]):
-        return jsonify({
-            "error": "Missing required parameters: owner, repo, workflow_id, start_date, end_date"
-        }), 400
-    
-    # Parse dates
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-    
-    if not start_date or not end_date:
-        return jsonify({
-            "error": "Invalid date format. Please use ISO 8601 format."
-        }), 400
-    
     # Parse optional parameters
     limit_str = request.args.get('limit', '10')
     try:
@@ -1739,32 +1907,29 @@ def get_flakiest_jobs():
             "error": "Invalid limit parameter. Must be an integer."
         }), 400
     
-    conclusions = parse_conclusions_param(request.args.get('conclusions'))
-    exclude_statuses = parse_exclude_statuses_param(request.args.get('exclude_statuses'))
-    
     try:
         # Retrieve raw flaky job data from database
-        print(f"DEBUG: Calling get_flaky_jobs_summary with: owner={owner}, repo={repo}, workflow={workflow_id}, start={start_date}, end={end_date}", flush=True)
-        with get_db() as db:
-            flaky_jobs_data = db.get_flaky_jobs_summary(
-                owner=owner,
-                repo=repo,
-                workflow_id=workflow_id,
-                start_date=start_date,
-                end_date=end_date,
-                conclusions=conclusions,
-                exclude_statuses=exclude_statuses
-            )
+        print(f"DEBUG: Calling get_flaky_jobs_summary with: owner={filters.owner}, repo={filters.repo}, workflow={filters.workflow_id}, start={filters.start_date}, end={filters.end_date}", flush=True)
+        db = get_db()
+        flaky_jobs_data = db.get_flaky_jobs_summary(
+            owner=filters.owner,
+            repo=filters.repo,
+            workflow_id=filters.workflow_id,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            conclusions=filters.conclusions,
+            exclude_statuses=filters.exclude_statuses
+        )
         print(f"DEBUG: get_flaky_jobs_summary returned {len(flaky_jobs_data)} records", flush=True)
 
         # Calculate flakiness metrics and format results
         calculator = StatsCalculator()
         flaky_summaries = calculator.calculate_flakiness_metrics(
             flaky_jobs_data=flaky_jobs_data,
-            owner=owner,
-            repo=repo,
-            start_date=start_date,
-            end_date=end_date,
+            owner=filters.owner,
+            repo=filters.repo,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
             limit=limit
         )
         print(f"DEBUG: calculate_flakiness_metrics returned {len(flaky_summaries)} summaries", flush=True)
@@ -1784,7 +1949,7 @@ def get_flakiest_jobs():
         
         # Handle empty result sets with informative metadata
         if not results:
-            metadata = build_filter_metadata(conclusions, exclude_statuses)
+            metadata = build_filter_metadata(filters.conclusions, filters.exclude_statuses)
             return jsonify({
                 "data": [],
                 "metadata": {
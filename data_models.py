@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from utils import generate_github_job_url
+from utils import generate_github_job_url, parse_iso_datetime
 
 @dataclass
 class Step:
@@ -15,9 +15,9 @@ class Step:
 
     def __post_init__(self):
         if self.started_at and isinstance(self.started_at, str):
-            self.started_at = datetime.fromisoformat(self.started_at.replace("Z", "+00:00"))
+            self.started_at = parse_iso_datetime(self.started_at)
         if self.completed_at and isinstance(self.completed_at, str):
-            self.completed_at = datetime.fromisoformat(self.completed_at.replace("Z", "+00:00"))
+            self.completed_at = parse_iso_datetime(self.completed_at)
         if self.started_at and self.completed_at:
             self.duration_ms = int((self.completed_at - self.started_at).total_seconds() * 1000)
 
@@ -37,9 +37,9 @@ class Job:
 
     def __post_init__(self):
         if self.started_at and isinstance(self.started_at, str):
-            self.started_at = datetime.fromisoformat(self.started_at.replace("Z", "+00:00"))
+            self.started_at = parse_iso_datetime(self.started_at)
         if self.completed_at and isinstance(self.completed_at, str):
-            self.completed_at = datetime.fromisoformat(self.completed_at.replace("Z", "+00:00"))
+            self.completed_at = parse_iso_datetime(self.completed_at)
         if self.started_at and self.completed_at:
             self.duration_ms = int((self.completed_at - self.started_at).total_seconds() * 1000)
 
@@ -61,9 +61,9 @@ class WorkflowRun:
 
     def __post_init__(self):
         if isinstance(self.created_at, str):
-            self.created_at = datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
+            self.created_at = parse_iso_datetime(self.created_at)
         if isinstance(self.updated_at, str):
-            self.updated_at = datetime.fromisoformat(self.updated_at.replace("Z", "+00:00"))
+            self.updated_at = parse_iso_datetime(self.updated_at)
         # duration_ms for WorkflowRun is computed in DataCollector after jobs are populated
 
 @dataclass
@@ -86,11 +86,11 @@ class JobExecutionDetail:
         """Auto-generate GitHub URL after initialization."""
         # Handle datetime string parsing if needed
         if isinstance(self.workflow_created_at, str):
-            self.workflow_created_at = datetime.fromisoformat(self.workflow_created_at.replace("Z", "+00:00"))
+            self.workflow_created_at = parse_iso_datetime(self.workflow_created_at)
         if self.job_started_at and isinstance(self.job_started_at, str):
-            self.job_started_at = datetime.fromisoformat(self.job_started_at.replace("Z", "+00:00"))
+            self.job_started_at = parse_iso_datetime(self.job_started_at)
         if self.job_completed_at and isinstance(self.job_completed_at, str):
-            self.job_completed_at = datetime.fromisoformat(self.job_completed_at.replace("Z", "+00:00"))
+            self.job_completed_at = parse_iso_datetime(self.job_completed_at)
         
         # Generate GitHub URL
         self.github_url = generate_github_job_url(
@@ -1,5 +1,9 @@
 import sqlite3
-from typing import Optional, List, Dict, Any
+import math
+import threading
+from array import array
+import numpy as np
+from typing import Optional, List, Dict, Any, Iterator, Union
 import json
 from datetime import datetime
 
@@ -26,16 +30,151 @@ def validate_conclusions(conclusions: Optional[List[str]]) -> Optional[List[str]
     return conclusions
 
 
+# In-process count of committed data changes (see bump_data_version)
+_data_version = 0
+_data_version_lock = threading.Lock()
+
+
+def get_data_version() -> int:
+    """Returns the in-process data version, advanced by bump_data_version after each data write."""
+    return _data_version
+
+
+def bump_data_version() -> int:
+    """
+    Advances the in-process data version, so results cached under an older one are not reused.
+
+    :return: The new data version
+    """
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
+        return _data_version
+
+
+# Applied to read-only connections, which are long-lived and only serve dashboard queries
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -65536",  # 64 MiB
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Prepared statements kept per read-only connection. Each query method yields a different
+# statement for every combination of filter placeholder counts, which can exceed sqlite3's
+# default of 128 on a long-lived connection
+READ_ONLY_STATEMENT_CACHE_SIZE = 256
+
+# Recorded in PRAGMA user_version once initialize_schema has created every table and applied
+# every migration; bump it when adding a migration so existing databases run it once
+SCHEMA_VERSION = 1
+
+FETCH_BATCH_SIZE = 500  # Rows fetched per cursor.fetchmany call by the iter_* query methods
+
+# Columns returned for workflow runs; internal ones such as max_job_duration_ms are left out
+WORKFLOW_RUN_COLUMNS = (
+    'id', 'owner', 'repo', 'workflow_id', 'name', 'created_at', 'updated_at', 'status', 'conclusion',
+    'duration_ms', 'event', 'head_branch', 'run_number', 'head_sha', 'pull_request_number',
+)
+
+# (alias, expression) pairs selected by GHADatabase.iter_job_executions_with_details
+JOB_EXECUTION_COLUMNS = (
+    ('job_id', 'j.id'),
+    ('workflow_run_id', 'j.workflow_run_id'),
+    ('job_name', 'j.name'),
+    ('job_conclusion', 'j.conclusion'),
+    ('job_duration_ms', 'j.duration_ms'),
+    ('job_started_at', 'j.started_at'),
+    ('job_completed_at', 'j.completed_at'),
+    ('workflow_conclusion', 'w.conclusion'),
+    ('created_at', 'w.created_at'),
+    ('owner', 'w.owner'),
+    ('repo', 'w.repo'),
+    # Same URL (or '' when a part is missing) as utils.generate_github_job_url
+    ('github_url', "CASE WHEN w.owner <> '' AND w.repo <> '' AND j.workflow_run_id AND j.id "
+                   "THEN printf('https://github.com/%s/%s/actions/runs/%d/job/%d', "
+                   "w.owner, w.repo, j.workflow_run_id, j.id) ELSE '' END"),
+)
+
+# ORDER BY clause for each order_by value accepted by GHADatabase.iter_job_executions_with_details
+JOB_EXECUTION_ORDER_BY = {
+    'duration_desc': 'j.duration_ms DESC',
+    'duration_asc': 'j.duration_ms ASC',
+    'created_desc': 'w.created_at DESC',
+    'created_asc': 'w.created_at ASC',
+}
+
+
+class PackInt64:
+    """
+    SQLite aggregate that packs non-NULL integer values into a BLOB of native-endian int64s.
+
+    Used instead of GROUP_CONCAT for duration lists so callers can decode the result
+    with ``np.frombuffer(blob, dtype=np.int64)`` rather than splitting and parsing text.
+    Like GROUP_CONCAT, it returns NULL when every input value is NULL.
+    """
+
+    def __init__(self):
+        self.values = array('q')
+
+    def step(self, value):
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        return self.values.tobytes() if self.values else None
+
+
+class Percentile:
+    """
+    SQLite aggregate ``percentile(value, q)`` returning the q-quantile (0 <= q <= 1) of
+    non-NULL values, linearly interpolated exactly like np.quantile. Returns NULL for no values.
+    """
+
+    def __init__(self):
+        self.values = array('q')
+        self.q = None
+
+    def step(self, value, q):
+        self.q = q
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        if not self.values:
+            return None
+        # Same index and interpolation formulas as np.quantile's default 'linear' method, but
+        # only the two neighbouring ranks are put in place with a partial sort; np.quantile's
+        # per-call overhead is ~10x the work itself for the small groups most queries produce
+        values = np.frombuffer(self.values, dtype=np.int64)
+        virtual = (len(values) - 1) * self.q
+        previous = math.floor(virtual)
+        gamma = virtual - previous
+        following = min(previous + 1, len(values) - 1)
+        values.partition((previous, following))
+        a = int(values[previous])
+        b = int(values[following])
+        diff = b - a
+        if gamma >= 0.5:
+            return float(b - diff * (1 - gamma))
+        return float(a + diff * gamma)
+
+
 class GHADatabase:
     """Manages all database interactions for the GHA Performance Analyzer."""
 
-    def __init__(self, db_path: str = "gha_metrics.db"):
+    def __init__(self, db_path: str = "gha_metrics.db", read_only: bool = False, persistent: bool = False):
         """
         Initializes the database connection.
 
         :param db_path: The path to the SQLite database file.
+        :param read_only: Open the database in read-only mode with read-tuned pragmas.
+        :param persistent: Keep the connection open when leaving a ``with`` block, so a
+                           long-lived instance can be reused across requests.
         """
         self.db_path = db_path
+        self.read_only = read_only
+        self.persistent = persistent
         self.conn: Optional[sqlite3.Connection] = None
 
     def __enter__(self):
@@ -43,16 +182,25 @@ class GHADatabase:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if not self.persistent:
+            self.close()
 
     def connect(self):
         """Establishes a connection to the SQLite database."""
         if self.conn is None:
             try:
-                self.conn = sqlite3.connect(self.db_path)
+                if self.read_only:
+                    self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                                cached_statements=READ_ONLY_STATEMENT_CACHE_SIZE)
+                    for pragma in READ_ONLY_PRAGMAS:
+                        self.conn.execute(pragma)
+                else:
+                    self.conn = sqlite3.connect(self.db_path)
                 self.conn.row_factory = sqlite3.Row # Return rows as dict-like objects
                 # Enable foreign key support
                 self.conn.execute("PRAGMA foreign_keys = 1")
+                self.conn.create_aggregate("pack_i64", 1, PackInt64)
+                self.conn.create_aggregate("percentile", 2, Percentile)
             except sqlite3.Error as e:
                 print(f"Error connecting to database: {e}")
                 raise
@@ -63,13 +211,31 @@ class GHADatabase:
             self.conn.close()
             self.conn = None
 
+    def get_data_version(self) -> int:
+        """
+        Returns SQLite's PRAGMA data_version for this connection.
+
+        The value changes whenever another connection, in this or any other process,
+        commits a change to the database.
+        """
+        if not self.conn:
+            raise ConnectionError("Database is not connected. Call connect() first.")
+
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
     def initialize_schema(self):
         """
         Initializes the database schema by creating tables and indexes if they don't exist.
+
+        Returns immediately once the database records SCHEMA_VERSION in PRAGMA user_version,
+        so callers that run on every fetch only pay for the migration checks once.
         """
         if not self.conn:
             raise ConnectionError("Database is not connected. Call connect() first.")
 
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
         schema_script = """
         -- Workflows Table: Stores one record per workflow run.
         CREATE TABLE IF NOT EXISTS workflows (
@@ -155,6 +321,34 @@ class GHADatabase:
                 else:
                     raise
         
+        # Longest job duration per workflow run, kept up to date by save_workflow_run so that
+        # job-based duration queries don't have to aggregate the whole jobs table. The column
+        # and its backfill are added in one transaction (sqlite3 would otherwise autocommit the
+        # ALTER on its own), and runs left NULL by an older, interrupted migration are
+        # backfilled until the schema version is recorded
+        self.conn.commit()
+        self.conn.execute("BEGIN")
+        try:
+            try:
+                self.conn.execute("ALTER TABLE workflows ADD COLUMN max_job_duration_ms INTEGER")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e).lower():
+                    raise
+            self.conn.execute("""
+                UPDATE workflows SET max_job_duration_ms = (
+                    SELECT MAX(j.duration_ms) FROM jobs j WHERE j.workflow_run_id = workflows.id
+                )
+                WHERE max_job_duration_ms IS NULL
+                  AND EXISTS (
+                      SELECT 1 FROM jobs j
+                      WHERE j.workflow_run_id = workflows.id AND j.duration_ms IS NOT NULL
+                  )
+            """)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        
         # Create indexes for flakiness queries
         flakiness_indexes = [
             "CREATE INDEX IF NOT EXISTS idx_jobs_run_attempt ON jobs(workflow_run_id, name, run_attempt, conclusion)",
@@ -191,6 +385,10 @@ class GHADatabase:
             self.conn.rollback()
             raise
 
+        # Every step above is idempotent, so the version is only recorded once all of them succeeded
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
     def save_workflow_run(self, workflow_run: WorkflowRun, owner: str, repo: str, workflow_id: str):
         """
         Saves a complete WorkflowRun object, including its jobs and steps, to the database.
@@ -242,11 +440,20 @@ class GHADatabase:
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, step_data)
 
+            # Refresh the precomputed job-based duration of this run
+            cursor.execute("""
+                UPDATE workflows SET max_job_duration_ms = (
+                    SELECT MAX(duration_ms) FROM jobs WHERE workflow_run_id = ?
+                )
+                WHERE id = ?
+            """, (workflow_run.id, workflow_run.id))
+
             self.conn.commit()
         except sqlite3.Error as e:
             print(f"Database error during save_workflow_run: {e}")
             self.conn.rollback()
             raise
+        bump_data_version()
 
     def clear_all_data(self):
         """
@@ -262,61 +469,153 @@ class GHADatabase:
             print(f"Database error during clear_all_data: {e}")
             self.conn.rollback()
             raise
+        bump_data_version()
 
-    def get_workflow_runs(self, owner: str, repo: str, workflow_id: str,
-                          start_date: Optional[datetime] = None,
-                          end_date: Optional[datetime] = None,
-                          conclusions: Optional[List[str]] = None,
-                          exclude_statuses: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def _workflow_runs_filter(self, owner: str, repo: str, workflow_id: str,
+                              start_date: Optional[datetime], end_date: Optional[datetime],
+                              conclusions: Optional[List[str]],
+                              exclude_statuses: Optional[List[str]]) -> tuple[str, List[Any]]:
         """
-        Retrieves workflow runs from the database with optional date filtering.
+        Builds the workflows WHERE clause shared by iter_workflow_runs, get_overall_run_metrics
+        and get_workflow_job_based_durations.
 
-        :param owner: The repository owner.
-        :param repo: The repository name.
-        :param workflow_id: The workflow file name (e.g., 'ci.yml').
-        :param start_date: Optional start date for filtering.
-        :param end_date: Optional end date for filtering.
-        :param conclusions: Optional list of conclusions to filter by (e.g., ['success', 'failure']).
-        :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
-        :return: A list of workflow runs, where each run is a dictionary.
+        :return: Tuple of (SQL starting with WHERE, params).
         """
-        if not self.conn:
-            raise ConnectionError("Database is not connected. Call connect() first.")
-
         # Validate conclusions if provided
         conclusions = validate_conclusions(conclusions)
 
-        query = "SELECT * FROM workflows WHERE owner = ? AND repo = ? AND workflow_id = ?"
+        where = " WHERE owner = ? AND repo = ? AND workflow_id = ?"
         params = [owner, repo, workflow_id]
 
         # Exclude incomplete workflows by default
         if exclude_statuses is None:
             exclude_statuses = ['in_progress', 'queued']
         if exclude_statuses:
-            query += " AND conclusion IS NOT NULL"
+            where += " AND conclusion IS NOT NULL"
             placeholders = ','.join('?' * len(exclude_statuses))
-            query += f" AND status NOT IN ({placeholders})"
+            where += f" AND status NOT IN ({placeholders})"
             params.extend(exclude_statuses)
 
         # Filter by conclusions
         if conclusions:
             placeholders = ','.join('?' * len(conclusions))
-            query += f" AND conclusion IN ({placeholders})"
+            where += f" AND conclusion IN ({placeholders})"
             params.extend(conclusions)
 
         if start_date:
-            query += " AND created_at >= ?"
+            where += " AND created_at >= ?"
             params.append(start_date)
         if end_date:
-            query += " AND created_at <= ?"
+            where += " AND created_at <= ?"
             params.append(end_date)
 
-        query += " ORDER BY created_at DESC"
+        return where, params
+
+    def get_workflow_runs(self, owner: str, repo: str, workflow_id: str,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None,
+                          conclusions: Optional[List[str]] = None,
+                          exclude_statuses: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves workflow runs as a list; see iter_workflow_runs.
+        """
+        return list(self.iter_workflow_runs(owner, repo, workflow_id, start_date, end_date,
+                                            conclusions=conclusions, exclude_statuses=exclude_statuses))
+
+    def iter_workflow_runs(self, owner: str, repo: str, workflow_id: str,
+                           start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None,
+                           conclusions: Optional[List[str]] = None,
+                           exclude_statuses: Optional[List[str]] = None,
+                           as_json: bool = False) -> Iterator[Union[Dict[str, Any], str]]:
+        """
+        Yields workflow runs from the database with optional date filtering, newest first.
+
+        Rows are fetched from the cursor in batches, as in iter_job_executions_with_details.
+        Parameters are validated when iteration starts, not when this is called.
+
+        :param owner: The repository owner.
+        :param repo: The repository name.
+        :param workflow_id: The workflow file name (e.g., 'ci.yml').
+        :param start_date: Optional start date for filtering.
+        :param end_date: Optional end date for filtering.
+        :param conclusions: Optional list of conclusions to filter by (e.g., ['success', 'failure']).
+        :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
+        :param as_json: If True, yield each run as a JSON object string instead of a dict.
+        :return: Iterator of workflow runs, each a dictionary (or JSON string).
+        """
+        if not self.conn:
+            raise ConnectionError("Database is not connected. Call connect() first.")
+
+        where, params = self._workflow_runs_filter(owner, repo, workflow_id, start_date, end_date,
+                                                   conclusions, exclude_statuses)
+        if as_json:
+            # Keys in sorted order, as jsonify emits them
+            select_list = "json_object(" + ", ".join(f"'{col}', {col}" for col in sorted(WORKFLOW_RUN_COLUMNS)) + ")"
+        else:
+            select_list = ", ".join(WORKFLOW_RUN_COLUMNS)
+        query = f"SELECT {select_list} FROM workflows{where} ORDER BY created_at DESC"
 
         cursor = self.conn.cursor()
+        if as_json:
+            cursor.row_factory = None
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            if as_json:
+                yield from (row[0] for row in rows)
+            else:
+                yield from map(dict, rows)
+
+    def get_overall_run_metrics(self, owner: str, repo: str, workflow_id: str, q: float,
+                                start_date: Optional[datetime] = None,
+                                end_date: Optional[datetime] = None,
+                                conclusions: Optional[List[str]] = None,
+                                exclude_statuses: Optional[List[str]] = None) -> tuple[int, int, Optional[float]]:
+        """
+        Returns the run counts and a percentile of successful run durations in one scan.
+
+        The total and successful run counts honour ``conclusions``; the percentile is taken over
+        max_job_duration_ms of the successful runs only, matching np.percentile(durations, q * 100).
+        All three share the remaining filters, so a single pass over the workflows with
+        conditional aggregates yields them together.
+
+        :param owner: The repository owner.
+        :param repo: The repository name.
+        :param workflow_id: The workflow file name (e.g., 'ci.yml').
+        :param q: Quantile to compute, in [0, 1] (e.g., 0.95).
+        :param start_date: Optional start date for filtering.
+        :param end_date: Optional end date for filtering.
+        :param conclusions: Optional list of conclusions the run counts are restricted to.
+        :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
+        :return: Tuple of (total runs, successful runs, percentile in milliseconds or None).
+        """
+        if not self.conn:
+            raise ConnectionError("Database is not connected. Call connect() first.")
+
+        conclusions = validate_conclusions(conclusions)
+        where, where_params = self._workflow_runs_filter(owner, repo, workflow_id, start_date, end_date,
+                                                         None, exclude_statuses)
+        if conclusions:
+            selected = f"conclusion IN ({','.join('?' * len(conclusions))})"
+            selected_params = list(conclusions)
+        else:
+            selected = "1"
+            selected_params = []
+
+        query = f"""
+            SELECT COUNT(CASE WHEN {selected} THEN 1 END),
+                   COUNT(CASE WHEN {selected} AND conclusion = 'success' THEN 1 END),
+                   percentile(CASE WHEN conclusion = 'success' THEN max_job_duration_ms END, ?)
+            FROM workflows""" + where
+        params = selected_params * 2 + [q] + where_params
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        total_runs, successful_runs, value = cursor.fetchone()
+        return total_runs, successful_runs, value
 
     def get_time_series_metrics(self, owner: str, repo: str, workflow_id: str,
                                 start_date: Optional[datetime] = None,
@@ -335,7 +634,8 @@ class GHADatabase:
         :param period: The time period to group by ('day' or 'week').
         :param conclusions: Optional list of conclusion values to filter by (e.g., ['success', 'failure']).
         :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
-        :return: A list of aggregated metrics, where each item is a dictionary.
+        :return: A list of aggregated metrics, where each item is a dictionary. Per-run durations
+                 are returned as packed int64 BLOBs in 'success_durations_blob' and 'all_durations_blob'.
         """
         if not self.conn:
             raise ConnectionError("Database is not connected. Call connect() first.")
@@ -359,17 +659,11 @@ class GHADatabase:
                 SUM(CASE WHEN w.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
                 SUM(CASE WHEN w.conclusion = 'failure' THEN 1 ELSE 0 END) as failed_runs,
                 SUM(CASE WHEN w.conclusion = 'cancelled' THEN 1 ELSE 0 END) as cancelled_runs,
-                AVG(job_durations.max_job_duration) as avg_duration_ms,
-                AVG(CASE WHEN w.conclusion = 'success' THEN job_durations.max_job_duration END) as avg_success_duration_ms,
-                GROUP_CONCAT(CASE WHEN w.conclusion = 'success' THEN job_durations.max_job_duration END) as success_durations_ms_list,
-                GROUP_CONCAT(job_durations.max_job_duration) as all_durations_ms_list
+                AVG(w.max_job_duration_ms) as avg_duration_ms,
+                AVG(CASE WHEN w.conclusion = 'success' THEN w.max_job_duration_ms END) as avg_success_duration_ms,
+                pack_i64(CASE WHEN w.conclusion = 'success' THEN w.max_job_duration_ms END) as success_durations_blob,
+                pack_i64(w.max_job_duration_ms) as all_durations_blob
             FROM workflows w
-            LEFT JOIN (
-                SELECT workflow_run_id, MAX(duration_ms) as max_job_duration
-                FROM jobs
-                WHERE duration_ms IS NOT NULL
-                GROUP BY workflow_run_id
-            ) job_durations ON w.id = job_durations.workflow_run_id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
         """
         params = [owner, repo, workflow_id]
@@ -430,7 +724,7 @@ class GHADatabase:
                 j.name as job_name,
                 COUNT(j.id) as total_runs,
                 SUM(CASE WHEN j.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
-                GROUP_CONCAT(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END) as success_durations_ms_list
+                CAST(percentile(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END, 0.95) AS INTEGER) as p95_duration_ms
             FROM jobs j
             JOIN workflows w ON j.workflow_run_id = w.id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
@@ -557,7 +851,7 @@ class GHADatabase:
                 COUNT(j.id) as total_runs,
                 SUM(CASE WHEN j.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
                 AVG(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END) as avg_success_duration_ms,
-                GROUP_CONCAT(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END) as success_durations_ms_list
+                CAST(percentile(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END, 0.95) AS INTEGER) as p95_duration_ms
             FROM jobs j
             JOIN workflows w ON j.workflow_run_id = w.id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
@@ -625,7 +919,7 @@ class GHADatabase:
                 SUM(CASE WHEN s.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
                 AVG(s.duration_ms) as avg_duration_ms,
                 AVG(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END) as avg_success_duration_ms,
-                GROUP_CONCAT(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END) as success_durations_ms_list
+                CAST(percentile(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END, 0.95) AS INTEGER) as p95_duration_ms
             FROM steps s
             JOIN jobs j ON s.job_id = j.id
             JOIN workflows w ON j.workflow_run_id = w.id
@@ -696,7 +990,7 @@ class GHADatabase:
                 COUNT(s.id) as total_runs,
                 SUM(CASE WHEN s.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
                 AVG(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END) as avg_success_duration_ms,
-                GROUP_CONCAT(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END) as success_durations_ms_list
+                CAST(percentile(CASE WHEN s.conclusion = 'success' THEN s.duration_ms END, 0.95) AS INTEGER) as p95_duration_ms
             FROM steps s
             JOIN jobs j ON s.job_id = j.id
             JOIN workflows w ON j.workflow_run_id = w.id
@@ -777,7 +1071,9 @@ class GHADatabase:
                 SUM(CASE WHEN j.conclusion = 'success' THEN 1 ELSE 0 END) as successful_runs,
                 AVG(j.duration_ms) as avg_duration_ms,
                 AVG(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END) as avg_success_duration_ms,
-                GROUP_CONCAT(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END) as success_durations_ms_list
+                CAST(percentile(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END, 0.5) AS INTEGER) as p50_duration_ms,
+                CAST(percentile(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END, 0.95) AS INTEGER) as p95_duration_ms,
+                CAST(percentile(CASE WHEN j.conclusion = 'success' THEN j.duration_ms END, 0.99) AS INTEGER) as p99_duration_ms
             FROM jobs j
             JOIN workflows w ON j.workflow_run_id = w.id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
@@ -816,7 +1112,28 @@ class GHADatabase:
                                        limit: Optional[int] = None,
                                        order_by: str = 'duration_desc') -> List[Dict[str, Any]]:
         """
-        Retrieves individual job executions with workflow context for GitHub URL generation.
+        Retrieves individual job executions as a list; see iter_job_executions_with_details.
+        """
+        return list(self.iter_job_executions_with_details(
+            owner, repo, workflow_id, job_name, start_date, end_date,
+            conclusions=conclusions, exclude_statuses=exclude_statuses, limit=limit, order_by=order_by
+        ))
+
+    def iter_job_executions_with_details(self, owner: str, repo: str, workflow_id: str,
+                                       job_name: str,
+                                       start_date: datetime, end_date: datetime,
+                                       conclusions: Optional[List[str]] = None,
+                                       exclude_statuses: Optional[List[str]] = None,
+                                       limit: Optional[int] = None,
+                                       order_by: str = 'duration_desc',
+                                       as_json: bool = False) -> Iterator[Union[Dict[str, Any], str]]:
+        """
+        Yields individual job executions with workflow context and GitHub job URLs.
+
+        Rows are fetched from the cursor in batches, so a large result set is never held in
+        memory at once. Parameters are validated when iteration starts, not when this is called.
+        With ``as_json``, SQLite encodes each row as a JSON object (json_object), so callers
+        that only serialize the rows skip building a dict per row.
         
         :param owner: The repository owner.
         :param repo: The repository name.
@@ -828,9 +1145,10 @@ class GHADatabase:
         :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
         :param limit: Optional limit on number of results.
         :param order_by: Sort order - 'duration_desc', 'duration_asc', 'created_desc', 'created_asc'.
-        :return: List of dicts with keys: job_id, workflow_run_id, job_name, job_conclusion,
-                 job_duration_ms, job_started_at, job_completed_at, workflow_conclusion, 
-                 created_at, owner, repo
+        :param as_json: If True, yield each row as a JSON object string instead of a dict.
+        :return: Iterator of dicts (or JSON strings) with keys: job_id, workflow_run_id, job_name,
+                 job_conclusion, job_duration_ms, job_started_at, job_completed_at,
+                 workflow_conclusion, created_at, owner, repo, github_url
         """
         if not self.conn:
             raise ConnectionError("Database is not connected. Call connect() first.")
@@ -839,29 +1157,19 @@ class GHADatabase:
         conclusions = validate_conclusions(conclusions)
 
         # Validate order_by parameter
-        valid_order_by = {
-            'duration_desc': 'j.duration_ms DESC',
-            'duration_asc': 'j.duration_ms ASC',
-            'created_desc': 'w.created_at DESC',
-            'created_asc': 'w.created_at ASC'
-        }
-        if order_by not in valid_order_by:
+        if order_by not in JOB_EXECUTION_ORDER_BY:
             raise ValueError(f"Invalid order_by value: {order_by}. "
-                           f"Valid values: {list(valid_order_by.keys())}")
+                           f"Valid values: {list(JOB_EXECUTION_ORDER_BY)}")
 
-        query = """
-            SELECT
-                j.id as job_id,
-                j.workflow_run_id,
-                j.name as job_name,
-                j.conclusion as job_conclusion,
-                j.duration_ms as job_duration_ms,
-                j.started_at as job_started_at,
-                j.completed_at as job_completed_at,
-                w.conclusion as workflow_conclusion,
-                w.created_at,
-                w.owner,
-                w.repo
+        if as_json:
+            # Keys in sorted order, as jsonify emits them
+            columns = ', '.join(f"'{alias}', {expr}" for alias, expr in sorted(JOB_EXECUTION_COLUMNS))
+            select_list = f"json_object({columns})"
+        else:
+            select_list = ', '.join(f"{expr} as {alias}" for alias, expr in JOB_EXECUTION_COLUMNS)
+
+        query = f"""
+            SELECT {select_list}
             FROM jobs j
             JOIN workflows w ON j.workflow_run_id = w.id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
@@ -886,7 +1194,7 @@ class GHADatabase:
             params.extend(conclusions)
         
         # Add ordering
-        query += f" ORDER BY {valid_order_by[order_by]}"
+        query += f" ORDER BY {JOB_EXECUTION_ORDER_BY[order_by]}"
         
         # Add limit if specified
         if limit:
@@ -894,9 +1202,17 @@ class GHADatabase:
             params.append(limit)
 
         cursor = self.conn.cursor()
+        if as_json:
+            cursor.row_factory = None
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            if as_json:
+                yield from (row[0] for row in rows)
+            else:
+                yield from map(dict, rows)
 
     def get_step_metrics_with_pattern(self, owner: str, repo: str, workflow_id: str,
                                      job_name: str,
@@ -918,13 +1234,36 @@ class GHADatabase:
         :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
         :return: List of step metrics grouped by workflow_run_id and step_name.
         """
+        return self.get_step_metrics_with_patterns(owner, repo, workflow_id, job_name, [step_pattern],
+                                                   start_date, end_date, conclusions, exclude_statuses)
+
+    def get_step_metrics_with_patterns(self, owner: str, repo: str, workflow_id: str,
+                                     job_name: str,
+                                     step_patterns: List[str],
+                                     start_date: datetime, end_date: datetime,
+                                     conclusions: Optional[List[str]] = None,
+                                     exclude_statuses: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves step metrics matching any of several SQL LIKE patterns in a single query.
+        
+        :param owner: The repository owner.
+        :param repo: The repository name.
+        :param workflow_id: The workflow file name (e.g., 'ci.yml').
+        :param job_name: The job name to filter by.
+        :param step_patterns: Non-empty list of SQL LIKE patterns (e.g., ['Build apps', 'Build linux-x64-%']).
+        :param start_date: The start date for filtering.
+        :param end_date: The end date for filtering.
+        :param conclusions: Optional list of workflow conclusions to filter by.
+        :param exclude_statuses: Optional list of statuses to exclude (default: ['in_progress', 'queued']).
+        :return: List of step metrics, most recent run first and each run's steps contiguous.
+        """
         if not self.conn:
             raise ConnectionError("Database is not connected. Call connect() first.")
 
         # Validate conclusions if provided
         conclusions = validate_conclusions(conclusions)
 
-        query = """
+        query = f"""
             SELECT
                 w.id as workflow_run_id,
                 w.created_at,
@@ -938,10 +1277,10 @@ class GHADatabase:
             JOIN workflows w ON j.workflow_run_id = w.id
             WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
               AND j.name = ?
-              AND s.name LIKE ?
+              AND ({' OR '.join(['s.name LIKE ?'] * len(step_patterns))})
               AND w.created_at >= ? AND w.created_at <= ?
         """
-        params = [owner, repo, workflow_id, job_name, step_pattern, start_date, end_date]
+        params = [owner, repo, workflow_id, job_name, *step_patterns, start_date, end_date]
         
         # Exclude incomplete workflows by default
         if exclude_statuses is None:
@@ -958,7 +1297,8 @@ class GHADatabase:
             query += f" AND w.conclusion IN ({placeholders})"
             params.extend(conclusions)
         
-        query += " ORDER BY w.created_at DESC, s.name ASC"
+        # w.id keeps each run's rows together when runs share a created_at
+        query += " ORDER BY w.created_at DESC, w.id DESC, s.name ASC"
 
         cursor = self.conn.cursor()
         cursor.execute(query, params)
@@ -1179,49 +1519,14 @@ class GHADatabase:
         if not self.conn:
             raise ConnectionError("Database is not connected. Call connect() first.")
 
-        # Validate conclusions if provided
-        conclusions = validate_conclusions(conclusions)
-
-        query = """
-            SELECT MAX(j.duration_ms) as max_job_duration
-            FROM workflows w
-            LEFT JOIN jobs j ON w.id = j.workflow_run_id
-            WHERE w.owner = ? AND w.repo = ? AND w.workflow_id = ?
-              AND j.duration_ms IS NOT NULL
-        """
-        params = [owner, repo, workflow_id]
-
-        # Exclude incomplete workflows by default
-        if exclude_statuses is None:
-            exclude_statuses = ['in_progress', 'queued']
-        if exclude_statuses:
-            query += " AND w.conclusion IS NOT NULL"
-            placeholders = ','.join('?' * len(exclude_statuses))
-            query += f" AND w.status NOT IN ({placeholders})"
-            params.extend(exclude_statuses)
-
-        # Filter by conclusions
-        if conclusions:
-            placeholders = ','.join('?' * len(conclusions))
-            query += f" AND w.conclusion IN ({placeholders})"
-            params.extend(conclusions)
-
-        if start_date:
-            query += " AND w.created_at >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND w.created_at <= ?"
-            params.append(end_date)
-
-        query += " GROUP BY w.id HAVING max_job_duration IS NOT NULL"
+        # max_job_duration_ms is kept up to date by save_workflow_run, so the jobs table is not needed
+        where, params = self._workflow_runs_filter(owner, repo, workflow_id, start_date, end_date,
+                                                   conclusions, exclude_statuses)
+        query = "SELECT max_job_duration_ms FROM workflows" + where + " AND max_job_duration_ms IS NOT NULL"
 
         cursor = self.conn.cursor()
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        # Extract durations as a list of integers
-        durations = [int(row['max_job_duration']) for row in rows if row['max_job_duration'] is not None]
-        return durations
+        return [row[0] for row in cursor.fetchall()]
 
     def get_rate_limit_state(self) -> Optional[Dict[str, Any]]:
         """
@@ -47,6 +47,8 @@ try:
         
         if all(table in tables for table in required_tables):
             print("Database schema verified successfully.")
+            # initialize_schema is idempotent; this applies column migrations to older databases
+            db.initialize_schema()
         else:
             print("WARNING: Database schema appears incomplete. Reinitializing...")
             db.initialize_schema()
@@ -72,11 +74,19 @@ echo "=========================================="
 # - bind to all interfaces on port 5000
 # - use 1 worker process (required for in-memory task manager to work across requests)
 # - use 4 threads per worker for concurrency
+#   (each open fetch status stream holds one thread until its fetch finishes, so app.py
+#   serves at most FETCH_STATUS_MAX_STREAMS of them and the dashboard polls beyond that;
+#   keep it below the thread count)
 # - set timeout to 300 seconds for long-running API calls and data fetches
+# - preload the app so imports happen once in the master process and are not repeated
+#   when a worker is restarted; gunicorn.conf.py compiles Numba kernels (if installed)
+#   in the worker after the fork
 # - enable access logging
 exec gunicorn --bind 0.0.0.0:5000 \
+    --config gunicorn.conf.py \
     --workers 1 \
     --threads 4 \
+    --preload \
     --timeout 300 \
     --access-logfile - \
     --error-logfile - \
@@ -0,0 +1,82 @@
+"""
+Compiled kernels for per-period duration statistics.
+
+Numba is an optional dependency: when it is not installed (for example on
+musl-based images where llvmlite has no wheels), NUMBA_AVAILABLE is False and
+callers fall back to the vectorized NumPy implementation.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _linear_quantile(sorted_values, start, count, q):
+        """Same index/interpolation formulas as np.quantile's default 'linear' method."""
+        virtual = (count - 1) * q
+        previous = np.floor(virtual)
+        gamma = virtual - previous
+        lo = start + int(previous)
+        hi = start + min(int(previous) + 1, count - 1)
+        a = sorted_values[lo]
+        b = sorted_values[hi]
+        diff = b - a
+        if gamma >= 0.5:
+            return b - diff * (1 - gamma)
+        return a + diff * gamma
+
+    @njit(parallel=True, cache=True)
+    def compute_period_stats(flat, offsets, out_p50, out_p95, out_p99, out_outliers, out_avg, exclude):
+        """
+        Fill per-period percentile/outlier outputs for durations stored back to back in ``flat``.
+
+        Period i owns ``flat[offsets[i]:offsets[i + 1]]`` (each slice must be non-empty).
+        When ``exclude`` is True, percentiles and ``out_avg`` ignore IQR outliers;
+        ``out_avg`` is left untouched otherwise.
+        """
+        for i in prange(len(offsets) - 1):
+            values = np.sort(flat[offsets[i]:offsets[i + 1]]).astype(np.float64)
+            count = len(values)
+
+            p25 = _linear_quantile(values, 0, count, 0.25)
+            p75 = _linear_quantile(values, 0, count, 0.75)
+            iqr = p75 - p25
+            lower_bound = p25 - (1.5 * iqr)
+            upper_bound = p75 + (1.5 * iqr)
+
+            # Values are sorted, so the non-outliers are the slice [below, kept_end)
+            # and both ends can be found by binary search
+            below = np.searchsorted(values, lower_bound, side='left')
+            kept_end = np.searchsorted(values, upper_bound, side='right')
+            out_outliers[i] = below + (count - kept_end)
+
+            if exclude:
+                start = below
+                count = kept_end - below
+                out_avg[i] = values[below:kept_end].sum() / count
+            else:
+                start = 0
+            out_p50[i] = _linear_quantile(values, start, count, 0.5)
+            out_p95[i] = _linear_quantile(values, start, count, 0.95)
+            out_p99[i] = _linear_quantile(values, start, count, 0.99)
+
+
+def warm_up():
+    """
+    Compile (or load from the on-disk cache) the kernels for the argument types callers use.
+
+    Compiling a parallel kernel starts Numba's thread pool, which must not happen in a
+    process that later forks; call this in each server worker after the fork.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    from numba import types
+    int_array = types.int64[::1]
+    float_array = types.float64[::1]
+    compute_period_stats.compile((int_array, int_array, float_array, float_array, float_array,
+                                  int_array, float_array, types.boolean))
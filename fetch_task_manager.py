@@ -33,6 +33,8 @@ class FetchTaskManager:
         """Initialize the task manager with empty task storage."""
         self.tasks: Dict[str, FetchTask] = {}
         self.lock = threading.Lock()
+        # Notified (under self.lock) whenever a task's state changes
+        self.changed = threading.Condition(self.lock)
     
     def create_task(self, config: Dict[str, Any]) -> str:
         """
@@ -77,6 +79,7 @@ class FetchTaskManager:
                     'message': message
                 }
                 task.updated_at = datetime.utcnow()
+                self.changed.notify_all()
     
     def complete_task(self, task_id: str, result: Dict[str, Any]) -> None:
         """
@@ -93,6 +96,7 @@ class FetchTaskManager:
                 task.status = 'completed'
                 task.result = result
                 task.updated_at = datetime.utcnow()
+                self.changed.notify_all()
     
     def fail_task(self, task_id: str, error: str) -> None:
         """
@@ -108,6 +112,7 @@ class FetchTaskManager:
                 task.status = 'failed'
                 task.error = error
                 task.updated_at = datetime.utcnow()
+                self.changed.notify_all()
     
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -121,29 +126,50 @@ class FetchTaskManager:
             or None if task not found
         """
         with self.lock:
-            if task_id not in self.tasks:
-                return None
-            
-            task = self.tasks[task_id]
-            
-            status_dict = {
-                'task_id': task.task_id,
-                'status': task.status,
-                'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat()
-            }
-            
-            if task.progress:
-                status_dict['progress'] = task.progress
-            
-            if task.result:
-                status_dict['result'] = task.result
-            
-            if task.error:
-                status_dict['error'] = task.error
-            
-            return status_dict
-
+            return self._status_dict(task_id)
+    
+    def wait_for_update(self, task_id: str, previous: Optional[Dict[str, Any]],
+                        timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Block until the task's status differs from a previously returned one.
+        
+        Args:
+            task_id: Unique task identifier
+            previous: Status dictionary the caller already has
+            timeout: Maximum number of seconds to wait (None waits indefinitely)
+        
+        Returns:
+            The current status dictionary (equal to previous if the timeout expired),
+            or None if task not found
+        """
+        with self.changed:
+            self.changed.wait_for(lambda: self._status_dict(task_id) != previous, timeout)
+            return self._status_dict(task_id)
+    
+    def _status_dict(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Build the status dictionary for a task; the caller must hold self.lock."""
+        if task_id not in self.tasks:
+            return None
+        
+        task = self.tasks[task_id]
+        
+        status_dict = {
+            'task_id': task.task_id,
+            'status': task.status,
+            'created_at': task.created_at.isoformat(),
+            'updated_at': task.updated_at.isoformat()
+        }
+        
+        if task.progress:
+            status_dict['progress'] = task.progress
+        
+        if task.result:
+            status_dict['result'] = task.result
+        
+        if task.error:
+            status_dict['error'] = task.error
+        
+        return status_dict
 
 def execute_fetch_task(task_manager: FetchTaskManager, task_id: str, 
                        owner: str, repo: str, workflow_id: str, 
@@ -177,7 +203,7 @@ def execute_fetch_task(task_manager: FetchTaskManager, task_id: str,
     import traceback
     from github_api_client import GitHubApiClient
     from data_collector import DataCollector
-    from database import GHADatabase
+    from database import GHADatabase, bump_data_version
     
     # Wrap everything in try-except to ensure task state is always updated
     try:
@@ -218,6 +244,7 @@ def execute_fetch_task(task_manager: FetchTaskManager, task_id: str,
         try:
             db = GHADatabase(db_path=db_path)
             db.connect()
+            db.initialize_schema()  # Ensure schema (and column migrations) exist
         except Exception as e:
             task_manager.fail_task(task_id, f"Failed to connect to database: {str(e)}")
             return
@@ -246,6 +273,8 @@ def execute_fetch_task(task_manager: FetchTaskManager, task_id: str,
         finally:
             # Ensure database connection is closed
             db.close()
+            # Cached dashboard results may predate the runs saved by this task
+            bump_data_version()
     
     except Exception as e:
         # Catch any unexpected errors and mark task as failed
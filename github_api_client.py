@@ -25,6 +25,9 @@ class GitHubApiClient:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # One session per client so consecutive API calls reuse the keep-alive HTTPS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self.max_retries = 5
         self.initial_backoff_seconds = 1
         self.db_path = db_path
@@ -38,6 +41,10 @@ class GitHubApiClient:
             except ImportError:
                 pass
 
+    def close(self):
+        """Close the client's session and its pooled connections."""
+        self.session.close()
+
     def _update_rate_limit_from_response(self, response):
         """Update rate limit tracker from response headers."""
         tracker = _get_tracker()
@@ -82,7 +89,7 @@ class GitHubApiClient:
                 # Wait if we're being throttled
                 self._wait_for_throttle()
                 
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self.session.get(url, params=params)
                 
                 # Update rate limit tracker from response
                 self._update_rate_limit_from_response(response)
@@ -221,7 +228,7 @@ class GitHubApiClient:
         try:
             # Use the /user endpoint as a lightweight way to validate the token
             url = f"{self.base_url}/user"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 return (True, None, None)
@@ -0,0 +1,9 @@
+"""
+Gunicorn server hooks. Command-line options are set in docker-entrypoint.sh.
+"""
+
+
+def post_worker_init(worker):
+    """Compile the optional Numba kernels in the worker, after the fork from the preloading master."""
+    from duration_kernels import warm_up
+    warm_up()
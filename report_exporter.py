@@ -1,9 +1,16 @@
 import json
 import csv
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Iterator
 import io
+import itertools
+import operator
 from datetime import datetime, timezone
 
+# Approximate size (in characters) of each chunk yielded when streaming CSV output
+CSV_CHUNK_SIZE = 64 * 1024
+# Number of rows handed to csv.writer.writerows at a time when streaming
+CSV_BATCH_ROWS = 1024
+
 class ReportExporter:
     def export_to_json(self, data: Dict[str, Any], filename: str):
         """Exports data to a JSON file."""
@@ -49,23 +56,63 @@ class ReportExporter:
         :param filter_metadata: Optional dict with filter information to include as header comments
         :return: CSV formatted string
         """
-        if not data:
-            return ""
-
-        output = io.StringIO()
         try:
-            # Write filter metadata as comments if provided
-            if filter_metadata:
-                self._write_filter_metadata_comments(output, filter_metadata)
-            
-            headers = data[0].keys()
-            writer = csv.DictWriter(output, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(data)
-            return output.getvalue()
+            return "".join(self.iter_csv_chunks(data, filter_metadata))
         except Exception as e:
             print(f"An error occurred during CSV string export: {e}")
             return ""
+
+    def iter_csv_chunks(self, data: Iterable[Dict[str, Any]], filter_metadata: Optional[Dict[str, Any]] = None,
+                        chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[str]:
+        """Yields CSV text incrementally so large exports can be streamed instead of built in memory.
+        
+        Rows are converted to tuples with operator.itemgetter and written in batches with
+        csv.writer.writerows, which loops in C instead of calling DictWriter.writerow per row.
+        The metadata comments and header are yielded as the first chunk; after that, output is
+        flushed whenever roughly chunk_size characters have accumulated. The header is taken
+        from the keys of the first row, and every row must have those keys.
+        
+        :param data: Iterable of dictionaries to export
+        :param filter_metadata: Optional dict with filter information to include as header comments
+        :param chunk_size: Approximate number of characters per yielded chunk
+        :return: Iterator over CSV text chunks (nothing is yielded for empty data)
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            return
+
+        output = io.StringIO()
+        if filter_metadata:
+            self._write_filter_metadata_comments(output, filter_metadata)
+
+        fieldnames = list(first_row.keys())
+        if len(fieldnames) == 1:
+            row_values = lambda row: (row[fieldnames[0]],)
+        else:
+            row_values = operator.itemgetter(*fieldnames)
+
+        writer = csv.writer(output)
+        writer.writerow(fieldnames)
+        # Send the comments and header right away so the client sees the first bytes
+        # before the rows are formatted
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+
+        rows = itertools.chain([first_row], rows)
+        while True:
+            batch = list(itertools.islice(rows, CSV_BATCH_ROWS))
+            if not batch:
+                break
+            writer.writerows(map(row_values, batch))
+            if output.tell() >= chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        if output.tell():
+            yield output.getvalue()
     
     def _write_filter_metadata_comments(self, file_obj, filter_metadata: Dict[str, Any]):
         """Writes filter metadata as CSV comment lines (lines starting with #).
@@ -6,6 +6,20 @@ import numpy as np
 from data_models import WorkflowRun, Job, Step, PerformanceMetrics, FlakyJobSummary
 from utils import generate_github_job_url
 
+
+def _count_outside(values: List[int], lower: float, upper: float) -> int:
+    """
+    Counts values below lower or above upper in a single vectorized pass.
+
+    :param values: Durations to check
+    :param lower: Lower threshold (values strictly below it are counted)
+    :param upper: Upper threshold (values strictly above it are counted)
+    :return: Number of values outside [lower, upper]
+    """
+    values = np.asarray(values)
+    return int(np.count_nonzero((values < lower) | (values > upper)))
+
+
 class StatsCalculator:
     def calculate_run_statistics(self, workflow_runs: List[WorkflowRun]) -> PerformanceMetrics:
         metrics = PerformanceMetrics()
@@ -69,8 +83,8 @@ class StatsCalculator:
             std_dev = np.std(success_durations)
             metrics.outlier_threshold_lower = float(mean - 2 * std_dev)
             metrics.outlier_threshold_upper = float(mean + 2 * std_dev)
-            metrics.outlier_count = sum(1 for d in success_durations 
-                                       if d < metrics.outlier_threshold_lower or d > metrics.outlier_threshold_upper)
+            metrics.outlier_count = _count_outside(success_durations, metrics.outlier_threshold_lower,
+                                                   metrics.outlier_threshold_upper)
 
         return metrics
 
@@ -147,8 +161,7 @@ class StatsCalculator:
                 std_dev = np.std(success_durations)
                 outlier_threshold_lower = float(mean - 2 * std_dev)
                 outlier_threshold_upper = float(mean + 2 * std_dev)
-                outlier_count = sum(1 for d in success_durations 
-                                   if d < outlier_threshold_lower or d > outlier_threshold_upper)
+                outlier_count = _count_outside(success_durations, outlier_threshold_lower, outlier_threshold_upper)
                 
                 stats["outlier_count"] = outlier_count
                 stats["outlier_threshold_lower"] = outlier_threshold_lower
@@ -235,8 +248,7 @@ class StatsCalculator:
                 std_dev = np.std(success_durations)
                 outlier_threshold_lower = float(mean - 2 * std_dev)
                 outlier_threshold_upper = float(mean + 2 * std_dev)
-                outlier_count = sum(1 for d in success_durations 
-                                   if d < outlier_threshold_lower or d > outlier_threshold_upper)
+                outlier_count = _count_outside(success_durations, outlier_threshold_lower, outlier_threshold_upper)
                 
                 stats["outlier_count"] = outlier_count
                 stats["outlier_threshold_lower"] = outlier_threshold_lower
@@ -1,7 +1,14 @@
 import unittest
+import gzip
 import os
-from datetime import datetime
-from database import GHADatabase
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
+import numpy as np
+import trends
+from database import GHADatabase, SCHEMA_VERSION
 from data_models import WorkflowRun, Job, Step
 
 class TestGHADatabase(unittest.TestCase):
@@ -37,5 +44,257 @@ class TestGHADatabase(unittest.TestCase):
         self.assertEqual(len(runs), 1)
         self.assertEqual(runs[0]['id'], 123)
 
+    def test_time_series_packs_durations(self):
+        created = datetime(2024, 1, 1, 12, 0, 0)
+        for run_id, conclusion, duration_s in [(1, "success", 60), (2, "failure", 90), (3, "success", 30)]:
+            run = WorkflowRun(
+                id=run_id, name="Test Workflow", status="completed", conclusion=conclusion,
+                created_at=created, updated_at=created, event="push", head_branch="main",
+                run_number=run_id
+            )
+            run.jobs.append(Job(
+                id=run_id * 10, name="build", status="completed", conclusion=conclusion,
+                started_at=created, completed_at=created + timedelta(seconds=duration_s),
+                workflow_run_id=run_id
+            ))
+            self.db.save_workflow_run(run, "owner", "repo", "ci.yml")
+
+        trends = self.db.get_time_series_metrics("owner", "repo", "ci.yml")
+        self.assertEqual(len(trends), 1)
+        success = np.frombuffer(trends[0]['success_durations_blob'], dtype=np.int64)
+        all_durations = np.frombuffer(trends[0]['all_durations_blob'], dtype=np.int64)
+        self.assertEqual(sorted(success.tolist()), [30000, 60000])
+        self.assertEqual(sorted(all_durations.tolist()), [30000, 60000, 90000])
+
+    def test_initialize_schema_backfills_max_job_duration(self):
+        created = datetime(2024, 1, 1, 12, 0, 0)
+        run = WorkflowRun(
+            id=1, name="Test Workflow", status="completed", conclusion="success",
+            created_at=created, updated_at=created, event="push", head_branch="main", run_number=1
+        )
+        run.jobs.append(Job(
+            id=10, name="build", status="completed", conclusion="success",
+            started_at=created, completed_at=created + timedelta(seconds=45), workflow_run_id=1
+        ))
+        self.db.save_workflow_run(run, "owner", "repo", "ci.yml")
+        # Simulate a database whose earlier migration added the column but never backfilled it
+        self.db.conn.execute("UPDATE workflows SET max_job_duration_ms = NULL")
+        self.db.conn.commit()
+
+        # Migrations only run while the schema version is not recorded yet
+        self.db.initialize_schema()
+        value = self.db.conn.execute("SELECT max_job_duration_ms FROM workflows WHERE id = 1").fetchone()[0]
+        self.assertIsNone(value)
+
+        self.db.conn.execute("PRAGMA user_version = 0")
+        self.db.initialize_schema()
+        value = self.db.conn.execute("SELECT max_job_duration_ms FROM workflows WHERE id = 1").fetchone()[0]
+        self.assertEqual(value, 45000)
+        user_version = self.db.conn.execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(user_version, SCHEMA_VERSION)
+
+    def test_percentile_aggregate_matches_numpy(self):
+        values = [120, 45, 300, 87, 87, 610, 12]
+        self.db.conn.execute("CREATE TEMP TABLE samples (v INTEGER)")
+        self.db.conn.executemany("INSERT INTO samples VALUES (?)", [(v,) for v in values] + [(None,)])
+        p95 = self.db.conn.execute("SELECT percentile(v, 0.95) FROM samples").fetchone()[0]
+        self.assertEqual(p95, np.percentile(values, 95))
+        empty = self.db.conn.execute("SELECT percentile(v, 0.95) FROM samples WHERE v IS NULL").fetchone()[0]
+        self.assertIsNone(empty)
+
+    def test_read_only_connection_rejects_writes(self):
+        with GHADatabase(self.db_path, read_only=True, persistent=True) as ro_db:
+            self.assertEqual(ro_db.get_workflow_runs("owner", "repo", "ci.yml"), [])
+            with self.assertRaises(sqlite3.OperationalError):
+                ro_db.conn.execute("DELETE FROM workflows")
+        # Persistent connections outlive the with block until closed explicitly
+        self.assertIsNotNone(ro_db.conn)
+        ro_db.close()
+
+def reference_duration_stats(durations, exclude_outliers):
+    """Per-period statistics computed the plain way, one np.percentile call at a time."""
+    values = np.asarray(durations, dtype=np.float64)
+    p25, p75 = np.percentile(values, [25, 75])
+    iqr = p75 - p25
+    inside = (values >= p25 - 1.5 * iqr) & (values <= p75 + 1.5 * iqr)
+    stats = {'outlier_count': int((~inside).sum())}
+    if exclude_outliers:
+        values = values[inside]
+        stats['avg'] = values.mean()
+    stats['p50'], stats['p95'], stats['p99'] = np.percentile(values, [50, 95, 99])
+    return stats
+
+
+def pack(durations):
+    return np.asarray(durations, dtype=np.int64).tobytes() if len(durations) else None
+
+
+class TestTrendStats(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1234)
+        # Mostly typical run times with a few slow outliers, of varying period sizes
+        self.periods = []
+        for size in rng.integers(1, 60, size=300):
+            durations = rng.integers(60_000, 900_000, size=size)
+            if size > 4:
+                durations[rng.integers(0, size)] = 5_000_000
+            self.periods.append(durations)
+        self.periods[:4] = [np.array([42_000]), np.array([7, 7]), np.array([5, 1, 3]), np.array([0, 0, 0, 0])]
+
+    def assert_matches_reference(self, periods, exclude_outliers):
+        stats = trends._batched_duration_stats([pack(p) for p in periods], exclude_outliers)
+        for i, durations in enumerate(periods):
+            expected = reference_duration_stats(durations, exclude_outliers)
+            for key, value in expected.items():
+                self.assertAlmostEqual(float(stats[key][i]), value, places=6, msg=f"period {i} {key}")
+
+    def test_numpy_path_matches_reference(self):
+        batch = self.periods[:trends.NUMBA_MIN_PERIODS - 1]
+        for exclude_outliers in (False, True):
+            self.assert_matches_reference(batch, exclude_outliers)
+
+    def test_float_path_for_durations_above_int32_limit(self):
+        batch = [p + trends.INT32_DURATION_LIMIT for p in self.periods[:20]]
+        self.assertEqual(trends._stack_sorted_durations([pack(p) for p in batch])[0].dtype, np.float64)
+        for exclude_outliers in (False, True):
+            self.assert_matches_reference(batch, exclude_outliers)
+
+    def test_thread_pool_path_matches_reference(self):
+        batch = self.periods[:trends.STATS_POOL_MIN_PERIODS]
+        with mock.patch.object(trends, 'NUMBA_AVAILABLE', False), \
+                mock.patch.object(trends.os, 'cpu_count', return_value=4), \
+                mock.patch.object(trends, '_numpy_duration_stats', wraps=trends._numpy_duration_stats) as numpy_stats:
+            for exclude_outliers in (False, True):
+                self.assert_matches_reference(batch, exclude_outliers)
+        # Each call was split into one chunk per worker
+        self.assertEqual(numpy_stats.call_count, 8)
+
+    @unittest.skipUnless(trends.NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba_path_matches_reference(self):
+        batch = self.periods[:trends.NUMBA_MIN_PERIODS]
+        with mock.patch.object(trends, '_numpy_duration_stats') as numpy_stats:
+            for exclude_outliers in (False, True):
+                self.assert_matches_reference(batch, exclude_outliers)
+        numpy_stats.assert_not_called()
+
+    def test_compute_trends_fills_empty_and_single_run_periods(self):
+        periods = [np.array([], dtype=np.int64), np.array([42_000]), self.periods[10]]
+        for exclude_outliers in (False, True):
+            rows = [
+                {'period_start': f'2024-01-0{i + 1}', 'avg_duration_ms': 1.0, 'avg_success_duration_ms': 1.0,
+                 'success_durations_blob': pack(p), 'all_durations_blob': pack(p)}
+                for i, p in enumerate(periods)
+            ]
+            result = trends.compute_trends(rows, exclude_outliers)
+
+            self.assertNotIn('success_durations_blob', result[0])
+            self.assertIsNone(result[0]['p95_duration_ms'])
+            self.assertEqual(result[0]['outlier_count'], 0)
+            self.assertEqual(result[0]['avg_duration_ms'], 1.0)
+            for row, durations in zip(result[1:], periods[1:]):
+                expected = reference_duration_stats(durations, exclude_outliers)
+                self.assertEqual(row['p50_duration_ms'], int(expected['p50']))
+                self.assertEqual(row['p95_duration_ms'], int(expected['p95']))
+                self.assertEqual(row['p99_duration_ms'], int(expected['p99']))
+                self.assertEqual(row['outlier_count'], expected['outlier_count'])
+                if exclude_outliers:
+                    self.assertAlmostEqual(row['avg_success_duration_ms'], expected['avg'])
+                    self.assertAlmostEqual(row['avg_duration_ms'], expected['avg'])
+
+    def test_compute_trends_skips_outlier_count_when_not_requested(self):
+        rows = [{'success_durations_blob': pack(self.periods[10]), 'all_durations_blob': pack(self.periods[10])}]
+        result = trends.compute_trends(rows, exclude_outliers=False, include_outlier_count=False)
+        self.assertIsNone(result[0]['outlier_count'])
+        self.assertEqual(result[0]['p95_duration_ms'], int(np.percentile(self.periods[10], 95)))
+
+class TestApiResponses(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.tmpdir, "gha_metrics.db")
+        # app reads its paths and initializes the database on import
+        with mock.patch.dict(os.environ, {"DB_PATH": cls.db_path,
+                                          "CONFIG_PATH": os.path.join(cls.tmpdir, "config.json")}):
+            import app
+        cls.app_module = app
+        cls.client = app.app.test_client()
+        for run_id in range(1, 41):
+            cls.save_run(run_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        db = getattr(cls.app_module._thread_local, 'db', None)
+        if db is not None:
+            db.close()
+            cls.app_module._thread_local.db = None
+        shutil.rmtree(cls.tmpdir)
+
+    @classmethod
+    def save_run(cls, run_id):
+        created = datetime(2024, 1, 1 + run_id % 20, 12, 0, 0)
+        run = WorkflowRun(
+            id=run_id, name="Test Workflow", status="completed", conclusion="success",
+            created_at=created, updated_at=created, event="push", head_branch="main", run_number=run_id
+        )
+        run.jobs.append(Job(
+            id=run_id * 10, name="build", status="completed", conclusion="success",
+            started_at=created, completed_at=created + timedelta(seconds=30 + run_id), workflow_run_id=run_id
+        ))
+        with GHADatabase(cls.db_path) as db:
+            db.save_workflow_run(run, "owner", "repo", "ci.yml")
+
+    def setUp(self):
+        self.app_module._response_cache.clear()
+
+    def test_buffered_response_is_gzipped(self):
+        url = "/api/workflows?owner=owner&repo=repo&workflow_id=ci.yml"
+        plain = self.client.get(url)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertEqual(len(plain.get_json()), 40)
+
+        compressed = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed.headers['Vary'])
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+
+    def test_streamed_response_is_gzipped(self):
+        url = "/api/trends.csv?owner=owner&repo=repo&workflow_id=ci.yml"
+        plain = self.client.get(url)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn(b"p95_duration", plain.data)
+
+        compressed = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', compressed.headers)
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+
+    def test_repeated_request_is_cached_and_conditional(self):
+        url = "/api/trends?owner=owner&repo=repo&workflow_id=ci.yml"
+        first = self.client.get(url)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        second = self.client.get(url)
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+
+        etag = first.headers['ETag']
+        self.assertEqual(second.headers['ETag'], etag)
+        not_modified = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.data, b"")
+
+    def test_etag_changes_after_write(self):
+        url = "/api/overall-metrics?owner=owner&repo=repo&workflow_id=ci.yml"
+        etag = self.client.get(url).headers['ETag']
+        self.save_run(41)
+        try:
+            response = self.client.get(url, headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['X-Cache'], 'MISS')
+            self.assertNotEqual(response.headers['ETag'], etag)
+        finally:
+            with GHADatabase(self.db_path) as db:
+                db.conn.execute("DELETE FROM workflows WHERE id = 41")
+                db.conn.commit()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,296 @@
+"""
+Per-period percentile and IQR outlier statistics for the workflow trend endpoints.
+
+Durations arrive from GHADatabase.get_time_series_metrics as packed int64 BLOBs, one
+per period. Large batches use the compiled kernel in duration_kernels when Numba is
+installed; everything else runs as vectorized NumPy over a row-sorted matrix.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any
+import itertools
+import os
+import threading
+
+import numpy as np
+
+from duration_kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from duration_kernels import compute_period_stats
+
+NUMBA_MIN_PERIODS = 64  # Trend batches at least this large use the Numba kernel (when installed)
+STATS_POOL_MIN_PERIODS = 256  # Without Numba, trend batches at least this large are split across threads
+INT32_DURATION_LIMIT = np.iinfo(np.int32).max // 3  # Batches with durations up to this (ms, ~8 days) are sorted as int32
+
+# Serializes calls into the parallel Numba kernel
+_numba_lock = threading.Lock()
+
+# Thread pool for splitting large NumPy trend batches (created lazily)
+_stats_pool: Optional[ThreadPoolExecutor] = None
+_stats_pool_lock = threading.Lock()
+
+
+def _get_stats_pool() -> ThreadPoolExecutor:
+    """Returns the shared thread pool for trend statistics, creating it on first use (after any worker fork)."""
+    global _stats_pool
+    with _stats_pool_lock:
+        if _stats_pool is None:
+            _stats_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='trend-stats')
+    return _stats_pool
+
+
+def _decode_duration_blobs(blobs: List[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode packed int64 duration BLOBs into one contiguous array plus per-period counts.
+
+    The BLOBs are joined into a single buffer and viewed once, rather than creating an
+    array object per period and concatenating them.
+
+    :param blobs: Duration BLOBs, one per period
+    :return: Tuple of (writable int64 array of all durations in period order, per-period value counts)
+    """
+    # bytearray keeps the joined buffer writable, which the Numba kernel's signature expects
+    values = np.frombuffer(bytearray().join(blobs), dtype=np.int64)
+    counts = np.fromiter(map(len, blobs), dtype=np.int64, count=len(blobs))
+    counts //= values.itemsize
+    return values, counts
+
+
+def _stack_sorted_durations(blobs: List[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode packed int64 duration BLOBs into one row-sorted 2-D array.
+
+    Rows are padded with a value above any IQR fence (+inf, or the int32 maximum) so that,
+    after sorting, each row's real values occupy the leading ``counts[i]`` columns.
+    Batches whose durations all fit in [0, INT32_DURATION_LIMIT] are stored as int32,
+    which halves the bytes the sort has to move; others fall back to float64.
+
+    :param blobs: Non-empty duration BLOBs, one per period
+    :return: Tuple of (sorted array of shape (periods, max_count), per-row value counts)
+    """
+    values, counts = _decode_duration_blobs(blobs)
+    if values.min() >= 0 and values.max() <= INT32_DURATION_LIMIT:
+        matrix = np.full((len(blobs), counts.max()), np.iinfo(np.int32).max, dtype=np.int32)
+    else:
+        matrix = np.full((len(blobs), counts.max()), np.inf)
+    # Boolean-mask assignment fills in row-major order, i.e. in concatenation order
+    matrix[np.arange(matrix.shape[1]) < counts[:, None]] = values
+    matrix.sort(axis=1)
+    return matrix, counts
+
+
+def _sorted_row_quantiles(matrix: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                          quantiles: List[float]) -> np.ndarray:
+    """
+    Quantiles of ``matrix[i, starts[i]:starts[i] + counts[i]]`` for every row at once.
+
+    Rows must already be sorted. Uses the same index and interpolation formulas as
+    np.quantile's default 'linear' method, so results match a per-row np.quantile call exactly.
+
+    :param matrix: Row-sorted 2-D array
+    :param starts: First column of each row's slice
+    :param counts: Length of each row's slice (must be >= 1)
+    :param quantiles: Quantiles to compute, in [0, 1]
+    :return: Array of shape (len(quantiles), rows)
+    """
+    virtual = np.multiply.outer(counts - 1, np.asarray(quantiles, dtype=np.float64))
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+    previous = previous.astype(np.int64)
+    following = np.minimum(previous + 1, (counts - 1)[:, None])
+    rows = np.arange(matrix.shape[0])[:, None]
+    a = matrix[rows, starts[:, None] + previous]
+    b = matrix[rows, starts[:, None] + following]
+    diff = b - a
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma).T
+
+
+def _sorted_row_searchsorted(matrix: np.ndarray, values: np.ndarray, side: str = 'left') -> np.ndarray:
+    """
+    np.searchsorted for every row of a row-sorted matrix at once.
+
+    Runs a branchless binary search on all rows in lockstep, so the work is
+    O(rows * log(columns)) gathers instead of a full-size comparison mask.
+
+    :param matrix: Row-sorted 2-D array
+    :param values: One value to look up per row
+    :param side: 'left' or 'right', as for np.searchsorted
+    :return: int64 insertion index of each value within its row
+    """
+    rows, width = matrix.shape
+    goes_before = np.less if side == 'left' else np.less_equal
+    row_index = np.arange(rows)
+    position = np.zeros(rows, dtype=np.int64)
+    step = 1 << (width.bit_length() - 1)
+    while step:
+        # Columns [0, position) are known to go before the value; try to extend by step
+        candidate = np.minimum(position + step, width)
+        position = np.where(goes_before(matrix[row_index, candidate - 1], values), candidate, position)
+        step >>= 1
+    return position
+
+
+def _numba_duration_stats(blobs: List[bytes], exclude_outliers: bool) -> Dict[str, np.ndarray]:
+    """
+    Compute percentile and IQR outlier statistics for many periods with the compiled kernel.
+
+    :param blobs: Non-empty duration BLOBs, one per period
+    :param exclude_outliers: If True, percentiles and average are computed without IQR outliers
+    :return: Same dictionary layout as _numpy_duration_stats
+    """
+    values, counts = _decode_duration_blobs(blobs)
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    stats = {
+        'p50': np.empty(len(blobs)),
+        'p95': np.empty(len(blobs)),
+        'p99': np.empty(len(blobs)),
+        'outlier_count': np.empty(len(blobs), dtype=np.int64),
+        'avg': np.empty(len(blobs)),
+    }
+    # The kernel already runs across all cores, and Numba's default workqueue threading
+    # layer aborts on concurrent calls, so requests take turns
+    with _numba_lock:
+        compute_period_stats(values, offsets, stats['p50'], stats['p95'], stats['p99'],
+                             stats['outlier_count'], stats['avg'], exclude_outliers)
+    return stats
+
+
+def _numpy_duration_stats(blobs: List[bytes], exclude_outliers: bool,
+                          count_outliers: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Compute percentile and IQR outlier statistics for many periods in one vectorized pass.
+
+    :param blobs: Non-empty duration BLOBs, one per period
+    :param exclude_outliers: If True, percentiles and average are computed without IQR outliers
+    :param count_outliers: If False (only valid when not excluding outliers), the IQR fences
+                           are skipped and outlier_count is left out
+    :return: Dictionary of per-period arrays: p50, p95, p99, outlier_count (when counted) and,
+             when excluding outliers, avg
+    """
+    matrix, counts = _stack_sorted_durations(blobs)
+    if not count_outliers:
+        p50, p95, p99 = _sorted_row_quantiles(matrix, np.zeros_like(counts), counts, [0.5, 0.95, 0.99])
+        return {'p50': p50, 'p95': p95, 'p99': p99}
+
+    p25, p50, p75, p95, p99 = _sorted_row_quantiles(
+        matrix, np.zeros_like(counts), counts, [0.25, 0.5, 0.75, 0.95, 0.99]
+    )
+    iqr = p75 - p25
+    lower_bound = p25 - (1.5 * iqr)
+    upper_bound = p75 + (1.5 * iqr)
+
+    # Rows are sorted, so the values inside the IQR fences are the contiguous slice
+    # [below, kept_end); padding is +inf and always sorts after kept_end
+    below = _sorted_row_searchsorted(matrix, lower_bound, side='left')
+    kept_end = _sorted_row_searchsorted(matrix, upper_bound, side='right')
+    stats = {'p50': p50, 'p95': p95, 'p99': p99, 'outlier_count': below + (counts - kept_end)}
+
+    if exclude_outliers:
+        # The fences always contain the quartile range, so no slice is ever empty
+        kept = kept_end - below
+        stats['p50'], stats['p95'], stats['p99'] = _sorted_row_quantiles(matrix, below, kept, [0.5, 0.95, 0.99])
+        # Sum each kept slice straight from the flattened matrix; reduceat needs indices
+        # below len(flat), so the last row's slice is summed on its own
+        flat = matrix.ravel()
+        row_starts = np.arange(matrix.shape[0]) * matrix.shape[1]
+        bounds = np.column_stack((row_starts + below, row_starts + kept_end)).ravel()[:-1]
+        sums = np.add.reduceat(flat, bounds, dtype=np.promote_types(flat.dtype, np.int64))[::2]
+        sums[-1] = matrix[-1, below[-1]:kept_end[-1]].sum()
+        stats['avg'] = sums / kept
+
+    return stats
+
+
+def _batched_duration_stats(blobs: List[bytes], exclude_outliers: bool,
+                            count_outliers: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Compute per-period duration statistics, using the Numba kernel for large batches.
+
+    Small batches stay on NumPy, where there is little Python overhead left to remove.
+
+    :param blobs: Non-empty duration BLOBs, one per period
+    :param exclude_outliers: If True, percentiles and average are computed without IQR outliers
+    :param count_outliers: If False (only valid when not excluding outliers), outlier_count is left out
+    :return: Dictionary of per-period arrays: p50, p95, p99, outlier_count (when counted) and,
+             when excluding outliers, avg
+    """
+    if NUMBA_AVAILABLE and len(blobs) >= NUMBA_MIN_PERIODS:
+        # The kernel finds the fences in the same pass as the percentiles, so there is nothing to skip
+        stats = _numba_duration_stats(blobs, exclude_outliers)
+        if not count_outliers:
+            del stats['outlier_count']
+        return stats
+
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(blobs) >= STATS_POOL_MIN_PERIODS:
+        # NumPy releases the GIL while sorting, so row chunks can run concurrently
+        chunk_size = -(-len(blobs) // workers)
+        chunks = [blobs[i:i + chunk_size] for i in range(0, len(blobs), chunk_size)]
+        parts = list(_get_stats_pool().map(_numpy_duration_stats, chunks, itertools.repeat(exclude_outliers),
+                                           itertools.repeat(count_outliers)))
+        return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+    return _numpy_duration_stats(blobs, exclude_outliers, count_outliers)
+
+
+# Percentile/outlier fields of a trend row, for periods without successful runs
+TREND_STAT_DEFAULTS = {
+    'p50_duration_ms': None,
+    'p95_duration_ms': None,
+    'p99_duration_ms': None,
+    'outlier_count': 0,
+}
+
+
+def compute_trends(trends_raw: List[Any], exclude_outliers: bool,
+                    include_outlier_count: bool = True) -> List[Dict[str, Any]]:
+    """
+    Build time-series trend rows with percentile and outlier fields.
+
+    :param trends_raw: Dictionaries returned by GHADatabase.get_time_series_metrics; they are
+                       updated in place and become the returned rows
+    :param exclude_outliers: If True, averages and percentiles exclude IQR outliers
+    :param include_outlier_count: If False and outliers are not excluded, IQR outlier detection
+                                  is skipped and outlier_count is None
+    :return: List of trend dictionaries (duration BLOB columns removed)
+    """
+    count_outliers = exclude_outliers or include_outlier_count
+    defaults = TREND_STAT_DEFAULTS if count_outliers else {**TREND_STAT_DEFAULTS, 'outlier_count': None}
+    # The database layer already hands back one fresh dict per row, so reuse it
+    # instead of copying every row into another dict
+    success_blobs = [period_data.pop('success_durations_blob') for period_data in trends_raw]
+    all_blobs = [period_data.pop('all_durations_blob') for period_data in trends_raw]
+    for period_data in trends_raw:
+        period_data.update(defaults)
+    trends = trends_raw
+
+    # Recalculate overall average duration if outliers are excluded
+    rows = [i for i, blob in enumerate(all_blobs) if blob]
+    if exclude_outliers and rows:
+        stats = _batched_duration_stats([all_blobs[i] for i in rows], exclude_outliers=True)
+        for i, avg in zip(rows, stats['avg'].tolist()):
+            trends[i]['avg_duration_ms'] = avg
+
+    # The rest of the logic is for successful runs (percentiles, success average, outlier count)
+    rows = [i for i, blob in enumerate(success_blobs) if blob]
+    if not rows:
+        return trends
+
+    stats = _batched_duration_stats([success_blobs[i] for i in rows], exclude_outliers, count_outliers)
+    columns = [stats[key].astype(np.int64).tolist() for key in ('p50', 'p95', 'p99')]
+    for i, p50, p95, p99 in zip(rows, *columns):
+        data = trends[i]
+        data['p50_duration_ms'] = p50
+        data['p95_duration_ms'] = p95
+        data['p99_duration_ms'] = p99
+
+    if count_outliers:
+        for i, outlier_count in zip(rows, stats['outlier_count'].tolist()):
+            trends[i]['outlier_count'] = outlier_count
+
+    if exclude_outliers:
+        for i, avg in zip(rows, stats['avg'].tolist()):
+            trends[i]['avg_success_duration_ms'] = avg
+
+    return trends
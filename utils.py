@@ -1,5 +1,19 @@
+from datetime import datetime
 from typing import Optional, Union, List, Dict, Any
 import re
+import sys
+
+try:
+    # Optional C parser for ISO 8601 strings, faster than the stdlib
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts GitHub's trailing 'Z' natively, no string rewrite needed
+        parse_iso_datetime = datetime.fromisoformat
+    else:
+        def parse_iso_datetime(date_str: str) -> datetime:
+            """Parse an ISO 8601 timestamp, including a trailing 'Z' for UTC."""
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
 
 
 def format_duration_hms(duration_ms: Optional[Union[int, float]]) -> str:
@@ -58,7 +72,7 @@ def generate_github_job_url(owner: str, repo: str, workflow_run_id: int, job_id:
     >>> generate_github_job_url("owner", "repo", 67890, 12345)
     'https://github.com/owner/repo/actions/runs/67890/job/12345'
     """
-    if not all([owner, repo, workflow_run_id, job_id]):
+    if not (owner and repo and workflow_run_id and job_id):
         return ""
     return f"https://github.com/{owner}/{repo}/actions/runs/{workflow_run_id}/job/{job_id}"
 